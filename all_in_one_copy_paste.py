@@ -13,6 +13,7 @@ from PyQt6.QtWidgets import QApplication, QMessageBox, QMenu
 from PyQt6.QtCore import QMimeData
 from PyQt6.QtGui import QAction, QKeySequence, QShortcut
 from data_models import Entity
+from entity_export_import import invalidate_worldsector_sources
 
 class EntityClipboard:
     """Handles copy/paste operations for entities using export/import methodology"""
@@ -716,6 +717,7 @@ def setup_complete_smart_system(editor):
                 successfully_added.append(entity)
         
         # Update UI
+        invalidate_worldsector_sources(self)
         self.canvas.set_entities(self.entities)
         if hasattr(self, 'update_entity_tree'):
             self.update_entity_tree()
@@ -1010,6 +1012,7 @@ def setup_complete_smart_system(editor):
         self.selected_entity = None
         
         # Update UI
+        invalidate_worldsector_sources(self)
         self.canvas.set_entities(self.entities)
         if hasattr(self, 'update_entity_tree'):
             self.update_entity_tree()
@@ -17,6 +17,7 @@ import os
 import json
 import hashlib
 import pickle
+import threading
 import time
 from pathlib import Path
 from typing import Any, Optional, Dict, List, Tuple
@@ -44,6 +45,11 @@ class CacheManager:
     
     VERSION = "1.0"
     
+    # Background FCB cache saves wait this long for more conversions to batch up...
+    FCB_SAVE_DELAY = 1.0
+    # ...unless this many are already waiting
+    FCB_SAVE_BATCH = 256
+    
     def __init__(self, cache_dir="cache", enabled=True, max_memory_mb=500):
         """
         Initialize cache manager
@@ -72,7 +78,7 @@ class CacheManager:
         
         # In-memory caches (fast access during session)
         self.memory_caches = {
-            'fcb_conversion': {},    # {file_path: file_hash}
+            'fcb_conversion': {},    # {file_path: {'size': bytes, 'hash': content hash}}
             'xml_parsing': {},       # {(file_path, mod_time): entities_list}
             'object_parsing': {},    # {(file_path, obj_id): object_data}
             'terrain': {},           # {heightmap_path: pixmap}
@@ -83,6 +89,15 @@ class CacheManager:
         self.recent_levels = []  # List of recent level paths
         self.max_recent_levels = 10
         
+        # Background writer for the FCB conversion cache (started on first use)
+        self._fcb_save_lock = threading.Lock()  # Scheduling state and the cache snapshot
+        self._fcb_write_lock = threading.Lock()  # One writer of fcb_conversions.json at a time
+        self._fcb_save_wakeup = threading.Event()
+        self._fcb_save_now = threading.Event()
+        self._fcb_save_thread = None
+        self._fcb_save_stopping = False
+        self._fcb_pending_saves = 0
+        
         # Initialize if enabled
         if self.enabled:
             self._init_cache_dirs()
@@ -146,17 +161,83 @@ class CacheManager:
             return
         
         fcb_cache_file = self.cache_dir / "fcb_conversions.json"
+        temp_file = self.cache_dir / "fcb_conversions.json.tmp"
         try:
-            data = {
-                'version': self.VERSION,
-                'last_updated': datetime.now().isoformat(),
-                'conversions': self.memory_caches['fcb_conversion']
-            }
-            with open(fcb_cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with self._fcb_write_lock:
+                # Only the snapshot is taken under the save lock, so marking
+                # conversions never waits for the disk write below
+                with self._fcb_save_lock:
+                    conversions = self.memory_caches['fcb_conversion'].copy()
+                data = {
+                    'version': self.VERSION,
+                    'last_updated': datetime.now().isoformat(),
+                    'conversions': conversions
+                }
+                # Write the new file completely before it replaces the old one
+                try:
+                    with open(temp_file, 'w') as f:
+                        json.dump(data, f, indent=2)
+                    os.replace(temp_file, fcb_cache_file)
+                except BaseException:
+                    # Don't leave a half-written temp file behind
+                    try:
+                        os.remove(temp_file)
+                    except OSError:
+                        pass
+                    raise
         except Exception as e:
             print(f"Warning: Failed to save FCB cache: {e}")
     
+    def _schedule_fcb_save(self):
+        """Save the FCB conversion cache soon, on the background writer thread"""
+        if not self.enabled:
+            return
+        
+        # Callers may be on several threads - one writer, no lost counts
+        with self._fcb_save_lock:
+            if self._fcb_save_thread is None:
+                self._fcb_save_thread = threading.Thread(
+                    target=self._fcb_save_loop, name="FCBCacheWriter", daemon=True)
+                self._fcb_save_thread.start()
+            
+            self._fcb_pending_saves += 1
+            if self._fcb_pending_saves >= self.FCB_SAVE_BATCH:
+                self._fcb_save_now.set()
+            self._fcb_save_wakeup.set()
+    
+    def _fcb_save_loop(self):
+        """Background writer - coalesces scheduled saves into one write"""
+        while True:
+            self._fcb_save_wakeup.wait()
+            
+            # Let more conversions pile up unless a full batch is already waiting
+            if not self._fcb_save_stopping:
+                self._fcb_save_now.wait(self.FCB_SAVE_DELAY)
+            
+            # Under the lock so a save scheduled meanwhile is never cleared away
+            with self._fcb_save_lock:
+                self._fcb_save_wakeup.clear()
+                self._fcb_save_now.clear()
+                self._fcb_pending_saves = 0
+            
+            if self._fcb_save_stopping:
+                return
+            self._save_fcb_cache()
+    
+    def _stop_fcb_save_thread(self):
+        """Stop the background writer; the caller does the final save"""
+        thread = self._fcb_save_thread
+        if thread is None:
+            return
+        
+        self._fcb_save_stopping = True
+        self._fcb_save_now.set()
+        self._fcb_save_wakeup.set()
+        thread.join(timeout=5)
+        with self._fcb_save_lock:
+            self._fcb_save_thread = None
+            self._fcb_save_stopping = False
+    
     def _load_recent_levels(self):
         """Load recent levels list from disk"""
         recent_file = self.cache_dir / "recent_levels.json"
@@ -219,6 +300,23 @@ class CacheManager:
             print(f"Error hashing file {file_path}: {e}")
             return ""
     
+    def get_content_hash(self, file_path: str) -> str:
+        """
+        Hash a file's full contents with 8-byte BLAKE2b, reading 1MB at a time
+        
+        Returns:
+            Hex digest string, or empty string on error
+        """
+        hasher = hashlib.blake2b(digest_size=8)
+        try:
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    hasher.update(chunk)
+            return hasher.hexdigest()
+        except Exception as e:
+            print(f"Error hashing file {file_path}: {e}")
+            return ""
+    
     def get_file_mod_time(self, file_path: str) -> float:
         """Get file modification time, or 0 on error"""
         try:
@@ -256,7 +354,7 @@ class CacheManager:
         
         Returns True if:
         1. Converted XML file exists
-        2. FCB file hasn't changed since conversion (hash matches)
+        2. FCB file hasn't changed since conversion (size and content hash match)
         
         Args:
             fcb_file_path: Path to .fcb file
@@ -279,11 +377,8 @@ class CacheManager:
             self.stats['fcb_misses'] += 1
             return False
         
-        # Verify the hash matches (file hasn't changed)
-        cached_hash = self.memory_caches['fcb_conversion'][cache_key]
-        current_hash = self.get_file_hash(fcb_file_path, quick=True)
-        
-        if cached_hash == current_hash:
+        # Verify the size and content hash match (file hasn't changed)
+        if self._fcb_entry_matches(fcb_file_path, self.memory_caches['fcb_conversion'][cache_key]):
             self.stats['fcb_hits'] += 1
             return True
         else:
@@ -291,11 +386,79 @@ class CacheManager:
             self.stats['fcb_misses'] += 1
             return False
     
+    def filter_uncached(self, fcb_file_paths: List[str], dir_entries: Optional[Dict[str, Any]] = None) -> Tuple[List[str], int]:
+        """
+        Split FCB files into those needing conversion and cached ones in one pass
+        
+        Same rules as is_fcb_conversion_cached(), but when the folder's
+        os.scandir() entries are given the converted XML existence check is a
+        dict lookup instead of a stat per file.
+        
+        Args:
+            fcb_file_paths: Paths to .fcb files (all in the folder dir_entries describes)
+            dir_entries: Optional {file name: os.DirEntry} for that folder
+            
+        Returns:
+            (files that need conversion, number of cached files)
+        """
+        if not self.enabled:
+            return list(fcb_file_paths), 0
+        
+        conversions = self.memory_caches['fcb_conversion']
+        uncached = []
+        cached_count = 0
+        
+        for fcb_file_path in fcb_file_paths:
+            # Check if converted XML exists
+            if dir_entries is not None:
+                has_xml = os.path.basename(fcb_file_path) + '.converted.xml' in dir_entries
+            else:
+                has_xml = os.path.exists(fcb_file_path + '.converted.xml')
+            
+            # Check if we have a cached entry, then verify it still matches -
+            # the size comes from the directory scan when we have one
+            entry = conversions.get(os.path.abspath(fcb_file_path)) if has_xml else None
+            size = None
+            if entry is not None and dir_entries is not None:
+                dir_entry = dir_entries.get(os.path.basename(fcb_file_path))
+                if dir_entry is not None:
+                    size = dir_entry.stat().st_size
+            if entry is not None and self._fcb_entry_matches(fcb_file_path, entry, size):
+                cached_count += 1
+            else:
+                uncached.append(fcb_file_path)
+        
+        self.stats['fcb_hits'] += cached_count
+        self.stats['fcb_misses'] += len(uncached)
+        return uncached, cached_count
+    
+    def _fcb_entry_matches(self, fcb_file_path: str, entry: Any, size: Optional[int] = None) -> bool:
+        """
+        Whether a cached FCB entry still describes the file on disk
+        
+        The size is compared first, so the file is only read and hashed when
+        it could actually be unchanged.
+        """
+        if not isinstance(entry, dict):
+            # Entry from before sizes were stored - treat as changed once
+            return False
+        
+        if size is None:
+            try:
+                size = os.path.getsize(fcb_file_path)
+            except OSError:
+                return False
+        
+        if entry.get('size') != size:
+            return False
+        
+        return entry.get('hash') == self.get_content_hash(fcb_file_path)
+    
     def mark_fcb_converted(self, fcb_file_path: str):
         """
         Mark an FCB file as successfully converted
         
-        Stores the file hash so we can detect if it changes later
+        Stores the file size and content hash so we can detect if it changes later
         
         Args:
             fcb_file_path: Path to .fcb file that was converted
@@ -303,14 +466,20 @@ class CacheManager:
         if not self.enabled:
             return
         
-        file_hash = self.get_file_hash(fcb_file_path, quick=True)
+        try:
+            file_size = os.path.getsize(fcb_file_path)
+        except OSError:
+            return
+        
         cache_key = os.path.abspath(fcb_file_path)
         
-        self.memory_caches['fcb_conversion'][cache_key] = file_hash
+        self.memory_caches['fcb_conversion'][cache_key] = {
+            'size': file_size,
+            'hash': self.get_content_hash(fcb_file_path)
+        }
         
-        # Save to disk periodically (every 10 conversions)
-        if len(self.memory_caches['fcb_conversion']) % 10 == 0:
-            self._save_fcb_cache()
+        # Save to disk in the background - batched, so a long run never stalls on it
+        self._schedule_fcb_save()
     
     def invalidate_fcb_conversion(self, fcb_file_path: str):
         """Invalidate cached FCB conversion for a specific file"""
@@ -965,6 +1134,7 @@ class CacheManager:
         """
         if self.enabled:
             print("Shutting down cache manager...")
+            self._stop_fcb_save_thread()
             self._save_fcb_cache()
             self._save_recent_levels()
             print("✓ Cache manager shutdown complete")
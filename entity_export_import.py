@@ -1,9 +1,16 @@
 # entity_export_import.py - Entity Export/Import System for Level Editor
 
 import os
+import re
+import copy
 import json
+import html
 import xml.etree.ElementTree as ET
 import shutil
+import struct
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
                              QLabel, QLineEdit, QFileDialog, QMessageBox, 
                              QComboBox, QTextEdit, QGroupBox, QCheckBox,
@@ -14,43 +21,280 @@ from PyQt6.QtGui import QFont, QPixmap, QIcon
 from data_models import Entity
 import time
 
+# lxml is optional - used for the read-only collection parsing paths. Trees
+# that end up inside the editor's worldsector trees stay on the stdlib ET:
+# worldsectors_trees and entity xml_element objects are created by the editor
+# with xml.etree, and lxml elements cannot be inserted into (or indented,
+# copied and written alongside) those trees.
+try:
+    from lxml import etree as LET
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# orjson is optional - faster parsing of collection_info.json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Precompiled packers for the BinHex helpers
+_PACK_FFF = struct.Struct('<fff').pack
+_PACK_Q = struct.Struct('<Q').pack
+
+# Write buffer for saving (potentially very large) worldsector files
+SECTOR_WRITE_BUFFER_SIZE = 1 << 20
+
+# Upper bound on threads used to write exported entity files
+EXPORT_MAX_WORKERS = 8
+
+# batch_export_entities writes serially up to this many entities
+BATCH_EXPORT_PARALLEL_THRESHOLD = 16
+
+# Collections with more entities than this get compact collection_info.json
+COMPACT_METADATA_THRESHOLD = 500
+
+# Header scan used for the import preview (FCBConverter format only)
+PREVIEW_HEAD_BYTES = 8192
+_PREVIEW_FIELD_RE = re.compile(rb'<field\b[^>]*?\bname="(hidName|disEntityId|hidPos)"[^>]*>')
+_PREVIEW_VALUE_RES = {
+    b'hidName': re.compile(rb'\bvalue-String="([^"]*)"'),
+    b'disEntityId': re.compile(rb'\bvalue-Id64="([^"]*)"'),
+    b'hidPos': re.compile(rb'\bvalue-Vector3="([^"]*)"'),
+}
+
+# Source metadata recorded per exported entity
+_get_source_metadata = attrgetter('source_file', 'source_file_path', 'map_name')
+
+# Sector number in worldsector file names
+_WORLDSECTOR_RE = re.compile(r'worldsector(\d+)')
+
+# Characters not allowed in collection folder and entity file names
+_INVALID_FILENAME_CHARS = frozenset('<>:"/\\|?*')
+_SANITIZE_FILENAME = str.maketrans({c: '_' for c in _INVALID_FILENAME_CHARS})
+_COLLAPSE_UNDERSCORES = re.compile(r'_+')
+
+# Fields every exported entity must carry, in either format
+ESSENTIAL_ENTITY_FIELDS = ('hidName', 'disEntityId', 'hidPos')
+
+
+def _is_worldsector_file(name):
+    """Whether a file name is a converted worldsector XML file"""
+    return name.endswith('.converted.xml') and 'worldsector' in name
+
+
+def _collect_worldsector_sources(entities):
+    """Distinct worldsector files the entities were loaded from"""
+    sources = set()
+    for entity in entities:
+        source_file = getattr(entity, 'source_file_path', None)
+        if source_file and 'worldsector' in source_file:
+            sources.add(source_file)
+    return sources
+
+
+def _get_worldsector_sources(editor, exists=os.path.exists):
+    """Existing worldsector source files of the editor's entities
+    
+    The entities' source paths are collected once and cached on the editor
+    until invalidate_worldsector_sources() is called; existence is checked
+    on every call, so files removed from disk drop out.
+    """
+    entities = getattr(editor, 'entities', None)
+    if not entities:
+        return set()
+    
+    sources = getattr(editor, '_known_worldsector_sources', None)
+    if sources is None:
+        sources = _collect_worldsector_sources(entities)
+        editor._known_worldsector_sources = sources
+    return {source_file for source_file in sources if exists(source_file)}
+
+
+def invalidate_worldsector_sources(editor):
+    """Forget the cached worldsector sources - call whenever the editor's entities change"""
+    editor._known_worldsector_sources = None
+
+
+# collection_info.json path -> ((mtime_ns, size), metadata); survives dialog reopening
+_collection_metadata_cache = {}
+
+
+def _load_collection_metadata(metadata_path):
+    """Load collection_info.json, re-reading it only when the file has changed"""
+    stat = os.stat(metadata_path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    
+    cached = _collection_metadata_cache.get(metadata_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    with open(metadata_path, 'rb') as f:
+        data = f.read()
+    metadata = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+    
+    _collection_metadata_cache[metadata_path] = (key, metadata)
+    return metadata
+
 
 class XMLHelper:
     """Helper class for XML manipulation shared between export and import"""
     
+    SCANNED_FIELD_NAMES = frozenset(('hidPos', 'hidPos_precise', 'hidName', 'disEntityId'))
+    
+    @staticmethod
+    def scan_entity(xml_element):
+        """Collect the position/name/ID fields of an entity in a single tree walk.
+        
+        Returns a dict keyed by (tag, name), e.g. ('field', 'hidPos'), holding
+        the first matching descendant - the same element find() would return.
+        Pass it as ``fields`` to the extract_*/update_* helpers to skip their
+        own searches.
+        """
+        fields = {}
+        names = XMLHelper.SCANNED_FIELD_NAMES
+        for elem in xml_element.iter():
+            tag = elem.tag
+            if (tag == 'field' or tag == 'value') and elem is not xml_element:
+                name = elem.get('name')
+                if name in names and (tag, name) not in fields:
+                    fields[(tag, name)] = elem
+        return fields
+    
+    @staticmethod
+    def scan_entity_file(xml_path):
+        """Stream an exported entity file and return its scan_entity() fields.
+        
+        Nested objects are cleared as soon as they have been read, so only the
+        matched field elements stay alive instead of the whole tree.
+        """
+        fields = {}
+        names = XMLHelper.SCANNED_FIELD_NAMES
+        for _, elem in ET.iterparse(xml_path, events=('end',)):
+            tag = elem.tag
+            if tag == 'field' or tag == 'value':
+                name = elem.get('name')
+                if name in names and (tag, name) not in fields:
+                    fields[(tag, name)] = elem
+            elif tag == 'object':
+                elem.clear()
+        return fields
+    
+    @staticmethod
+    def preview_entity_file(xml_path):
+        """Read name, ID and position of an exported entity for list previews.
+        
+        Only the head of the file is regex-scanned for the FCBConverter
+        fields; if any is missing (Dunia Tools format, unusually large
+        header) the file is streamed with scan_entity_file() instead.
+        Returns (name, entity_id, x, y, z).
+        """
+        with open(xml_path, 'rb') as f:
+            head = f.read(PREVIEW_HEAD_BYTES)
+        
+        found = {}
+        for match in _PREVIEW_FIELD_RE.finditer(head):
+            name = match.group(1)
+            if name not in found:
+                value = _PREVIEW_VALUE_RES[name].search(match.group(0))
+                if value is not None:
+                    found[name] = html.unescape(value.group(1).decode('utf-8'))
+                    if len(found) == 3:
+                        break
+        
+        if len(found) == 3:
+            try:
+                x, y, z = map(float, found[b'hidPos'].split(','))
+                return found[b'hidName'], found[b'disEntityId'], x, y, z
+            except ValueError:
+                pass
+        
+        fields = XMLHelper.scan_entity_file(xml_path)
+        x, y, z = XMLHelper.extract_position_from_xml(None, fields)
+        return (XMLHelper.extract_entity_name(None, fields),
+                XMLHelper.extract_entity_id(None, fields), x, y, z)
+    
+    # Element -> 'field' (FCBConverter) or 'value' (Dunia Tools)
+    _format_cache = weakref.WeakKeyDictionary()
+    
+    @staticmethod
+    def detect_format(xml_element):
+        """Return the tag named fields use in this entity: 'field' or 'value'.
+        
+        Stops at the first named field and caches the answer per element.
+        Returns None when the entity has no named fields at all.
+        """
+        try:
+            return XMLHelper._format_cache[xml_element]
+        except (KeyError, TypeError):
+            pass
+        
+        xml_format = None
+        for elem in xml_element.iter():
+            if (elem.tag == 'field' or elem.tag == 'value') and elem.get('name') is not None:
+                xml_format = elem.tag
+                break
+        
+        try:
+            XMLHelper._format_cache[xml_element] = xml_format
+        except TypeError:
+            pass  # Element type without weak reference support
+        return xml_format
+    
     @staticmethod
-    def update_entity_position(xml_element, x, y, z):
+    def _find_field(xml_element, tag, name, fields=None):
+        """Look up a named field/value element, from a scan_entity() result if given"""
+        if fields is not None:
+            return fields.get((tag, name))
+        
+        # Skip the search entirely for the other format's tag
+        xml_format = XMLHelper.detect_format(xml_element)
+        if xml_format is not None and xml_format != tag:
+            return None
+        return xml_element.find(f".//{tag}[@name='{name}']")
+    
+    @staticmethod
+    def update_entity_position(xml_element, x, y, z, fields=None):
         """Update position fields in entity XML - works for both formats"""
         try:
             # FCBConverter format (has field elements)
-            pos_field = xml_element.find(".//field[@name='hidPos']")
+            pos_field = XMLHelper._find_field(xml_element, 'field', 'hidPos', fields)
             if pos_field is not None:
-                pos_field.set('value-Vector3', f"{x},{y},{z}")
+                vector = f"{x},{y},{z}"
+                pos_precise = XMLHelper._find_field(xml_element, 'field', 'hidPos_precise', fields)
+                
+                # Position unchanged (the usual export case) - skip the re-encode
+                if pos_field.get('value-Vector3') == vector and (
+                        pos_precise is None or pos_precise.get('value-Vector3') == vector):
+                    return True
+                
+                pos_field.set('value-Vector3', vector)
                 binary_hex = XMLHelper.coordinates_to_binhex(x, y, z)
                 pos_field.text = binary_hex
                 
                 # Also update hidPos_precise
-                pos_precise = xml_element.find(".//field[@name='hidPos_precise']")
                 if pos_precise is not None:
-                    pos_precise.set('value-Vector3', f"{x},{y},{z}")
+                    pos_precise.set('value-Vector3', vector)
                     pos_precise.text = binary_hex
                 return True
             
             # Dunia Tools format (has value elements)
-            pos_elem = xml_element.find(".//value[@name='hidPos']")
+            pos_elem = XMLHelper._find_field(xml_element, 'value', 'hidPos', fields)
             if pos_elem is not None:
-                for axis, value in [('x', x), ('y', y), ('z', z)]:
-                    axis_elem = pos_elem.find(f"./{axis}")
-                    if axis_elem is not None:
-                        axis_elem.text = str(int(value))
+                coords = {'x': str(int(x)), 'y': str(int(y)), 'z': str(int(z))}
+                for axis_elem in pos_elem:
+                    text = coords.get(axis_elem.tag)
+                    if text is not None and axis_elem.text != text:
+                        axis_elem.text = text
                 
                 # Also update hidPos_precise
-                pos_precise = xml_element.find(".//value[@name='hidPos_precise']")
+                pos_precise = XMLHelper._find_field(xml_element, 'value', 'hidPos_precise', fields)
                 if pos_precise is not None:
-                    for axis, value in [('x', x), ('y', y), ('z', z)]:
-                        axis_elem = pos_precise.find(f"./{axis}")
-                        if axis_elem is not None:
-                            axis_elem.text = str(int(value))
+                    for axis_elem in pos_precise:
+                        text = coords.get(axis_elem.tag)
+                        if text is not None and axis_elem.text != text:
+                            axis_elem.text = text
                 return True
                 
             return False
@@ -61,10 +305,8 @@ class XMLHelper:
     @staticmethod
     def coordinates_to_binhex(x, y, z):
         """Convert coordinates to BinHex format (IEEE 754 32-bit floats)"""
-        import struct
         try:
-            binary_data = struct.pack('<fff', float(x), float(y), float(z))
-            return binary_data.hex().upper()
+            return _PACK_FFF(float(x), float(y), float(z)).hex().upper()
         except Exception as e:
             print(f"Error converting to BinHex: {e}")
             return "000000000000000000000000"
@@ -72,19 +314,17 @@ class XMLHelper:
     @staticmethod
     def int64_to_binhex(value):
         """Convert 64-bit integer to BinHex format"""
-        import struct
         try:
-            binary_data = struct.pack('<Q', int(value))
-            return binary_data.hex().upper()
+            return _PACK_Q(int(value)).hex().upper()
         except:
             return "0000000000000000"
     
     @staticmethod
-    def update_entity_id(xml_element, new_id):
+    def update_entity_id(xml_element, new_id, fields=None):
         """Update entity ID in XML"""
         try:
             # FCBConverter format
-            id_field = xml_element.find(".//field[@name='disEntityId']")
+            id_field = XMLHelper._find_field(xml_element, 'field', 'disEntityId', fields)
             if id_field is not None:
                 id_field.set('value-Id64', str(new_id))
                 binary_hex = XMLHelper.int64_to_binhex(new_id)
@@ -92,7 +332,7 @@ class XMLHelper:
                 return True
             
             # Dunia Tools format
-            id_elem = xml_element.find(".//value[@name='disEntityId']")
+            id_elem = XMLHelper._find_field(xml_element, 'value', 'disEntityId', fields)
             if id_elem is not None:
                 id_elem.text = str(new_id)
                 return True
@@ -103,22 +343,23 @@ class XMLHelper:
             return False
     
     @staticmethod
-    def extract_position_from_xml(xml_element):
+    def extract_position_from_xml(xml_element, fields=None):
         """Extract position from XML element"""
         try:
             # FCBConverter format
-            pos_field = xml_element.find(".//field[@name='hidPos']")
+            pos_field = XMLHelper._find_field(xml_element, 'field', 'hidPos', fields)
             if pos_field is not None:
                 pos_vector = pos_field.get('value-Vector3', '0,0,0')
                 x, y, z = map(float, pos_vector.split(','))
                 return x, y, z
             
             # Dunia Tools format
-            pos_elem = xml_element.find(".//value[@name='hidPos']")
+            pos_elem = XMLHelper._find_field(xml_element, 'value', 'hidPos', fields)
             if pos_elem is not None:
-                x = float(pos_elem.find('./x').text or 0)
-                y = float(pos_elem.find('./y').text or 0)
-                z = float(pos_elem.find('./z').text or 0)
+                coords = {child.tag: child.text for child in pos_elem}
+                x = float(coords['x'] or 0)
+                y = float(coords['y'] or 0)
+                z = float(coords['z'] or 0)
                 return x, y, z
         except:
             pass
@@ -126,16 +367,16 @@ class XMLHelper:
         return 0.0, 0.0, 0.0
     
     @staticmethod
-    def extract_entity_name(xml_element):
+    def extract_entity_name(xml_element, fields=None):
         """Extract entity name from XML"""
         try:
             # FCBConverter format
-            name_field = xml_element.find(".//field[@name='hidName']")
+            name_field = XMLHelper._find_field(xml_element, 'field', 'hidName', fields)
             if name_field is not None:
                 return name_field.get('value-String', 'Unknown')
             
             # Dunia Tools format
-            name_elem = xml_element.find(".//value[@name='hidName']")
+            name_elem = XMLHelper._find_field(xml_element, 'value', 'hidName', fields)
             if name_elem is not None:
                 return name_elem.text or 'Unknown'
         except:
@@ -144,16 +385,16 @@ class XMLHelper:
         return 'Unknown'
     
     @staticmethod
-    def extract_entity_id(xml_element):
+    def extract_entity_id(xml_element, fields=None):
         """Extract entity ID from XML"""
         try:
             # FCBConverter format
-            id_field = xml_element.find(".//field[@name='disEntityId']")
+            id_field = XMLHelper._find_field(xml_element, 'field', 'disEntityId', fields)
             if id_field is not None:
                 return id_field.get('value-Id64', 'Unknown')
             
             # Dunia Tools format
-            id_elem = xml_element.find(".//value[@name='disEntityId']")
+            id_elem = XMLHelper._find_field(xml_element, 'value', 'disEntityId', fields)
             if id_elem is not None:
                 return id_elem.text or 'Unknown'
         except:
@@ -162,6 +403,102 @@ class XMLHelper:
         return 'Unknown'
 
 
+class EntityExportWorker(QThread):
+    """Background thread that writes the exported entity XML files"""
+    
+    progress_updated = pyqtSignal(int)  # Number of entities processed
+    export_complete = pyqtSignal(list)  # Metadata entries of exported entities
+    export_cancelled = pyqtSignal(int)  # Entity files written before the export stopped
+    error_occurred = pyqtSignal(str)  # Error message
+    
+    def __init__(self, dialog, entities, collection_folder, preserve_positions, include_metadata):
+        super().__init__()
+        self.dialog = dialog
+        self.entities = entities
+        self.collection_folder = collection_folder
+        self.preserve_positions = preserve_positions
+        self.include_metadata = include_metadata
+        self.should_stop = False
+    
+    def run(self):
+        """Export each entity and report the written files"""
+        try:
+            # Hoist loop-invariant lookups
+            join = os.path.join
+            folder = self.collection_folder
+            preserve_positions = self.preserve_positions
+            include_metadata = self.include_metadata
+            create_safe_filename = self.dialog.create_safe_filename
+            export_entity_to_xml = self.dialog.export_entity_to_xml
+            
+            # Name the files up front so numbering does not depend on completion order
+            jobs = []
+            for i, entity in enumerate(self.entities):
+                safe_name = create_safe_filename(entity.name)
+                xml_filename = f"{safe_name}_{i+1:03d}.xml"
+                jobs.append((entity, xml_filename, join(folder, xml_filename)))
+            
+            # Each file is independent - copy, format and write them in parallel
+            exported = []
+            cancelled_written = None
+            progress_step = max(1, len(jobs) // 100)
+            max_workers = max(1, min(EXPORT_MAX_WORKERS, len(jobs)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(export_entity_to_xml, entity, xml_path, preserve_positions)
+                           for entity, _, xml_path in jobs]
+                
+                for i, ((entity, xml_filename, _), future) in enumerate(zip(jobs, futures)):
+                    if self.should_stop:
+                        # Drop the queued files; ones already being written
+                        # still finish, so wait for them and count them too
+                        cancelled_written = len(exported) + sum(
+                            1 for pending in futures[i:] if not pending.cancel() and pending.result())
+                        break
+                    
+                    if future.result():
+                        entity_metadata = {
+                            'name': entity.name,
+                            'id': entity.id,
+                            'filename': xml_filename,
+                            'original_position': {
+                                'x': entity.x,
+                                'y': entity.y,
+                                'z': entity.z
+                            }
+                        }
+                        
+                        if include_metadata:
+                            try:
+                                source_file, source_file_path, map_name = _get_source_metadata(entity)
+                            except AttributeError:
+                                # source_file_path is only set on entities loaded from a file
+                                source_file = getattr(entity, 'source_file', None)
+                                source_file_path = getattr(entity, 'source_file_path', None)
+                                map_name = getattr(entity, 'map_name', None)
+                            
+                            entity_metadata.update({
+                                'source_file': source_file,
+                                'source_file_path': source_file_path,
+                                'map_name': map_name
+                            })
+                        
+                        exported.append(entity_metadata)
+                    
+                    # Throttled - every setValue on the progress dialog repaints
+                    if (i + 1) % progress_step == 0 or i + 1 == len(jobs):
+                        self.progress_updated.emit(i + 1)
+            
+            if cancelled_written is not None:
+                self.export_cancelled.emit(cancelled_written)
+            else:
+                self.export_complete.emit(exported)
+            
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            self.error_occurred.emit(str(e))
+
+
 class EntityExportDialog(QDialog):
     """Dialog for exporting selected entities to XML files"""
     
@@ -192,13 +529,11 @@ class EntityExportDialog(QDialog):
         preview_layout = QVBoxLayout(preview_group)
         
         self.entity_list = QListWidget()
-        for entity in self.selected_entities:
-            item_text = f"{entity.name} - ({entity.x:.1f}, {entity.y:.1f}, {entity.z:.1f})"
-            source = getattr(entity, 'source_file', 'unknown')
-            item_text += f" [{source}]"
-            
-            item = QListWidgetItem(item_text)
-            self.entity_list.addItem(item)
+        self.entity_list.addItems([
+            f"{entity.name} - ({entity.x:.1f}, {entity.y:.1f}, {entity.z:.1f})"
+            f" [{getattr(entity, 'source_file', 'unknown')}]"
+            for entity in self.selected_entities
+        ])
         
         preview_layout.addWidget(self.entity_list)
         layout.addWidget(preview_group)
@@ -267,13 +602,15 @@ class EntityExportDialog(QDialog):
             return
             
         if os.path.exists(self.objects_folder):
-            for item in os.listdir(self.objects_folder):
-                item_path = os.path.join(self.objects_folder, item)
-                if os.path.isdir(item_path):
+            with os.scandir(self.objects_folder) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
                     # Check if it contains entity XML files
-                    has_entities = any(f.endswith('.xml') for f in os.listdir(item_path))
+                    with os.scandir(entry.path) as sub_entries:
+                        has_entities = any(e.name.endswith('.xml') and e.is_file() for e in sub_entries)
                     if has_entities:
-                        self.existing_combo.addItem(item)
+                        self.existing_combo.addItem(entry.name)
     
     def on_existing_selected(self, collection_name):
         """Handle selection of existing collection"""
@@ -299,17 +636,10 @@ class EntityExportDialog(QDialog):
             return
         
         try:
-            # Create objects folder if it doesn't exist
-            if not os.path.exists(self.objects_folder):
-                os.makedirs(self.objects_folder)
-            
-            # Create collection folder
+            # Create collection folder (and the objects folder above it)
             collection_folder = os.path.join(self.objects_folder, collection_name)
-            if not os.path.exists(collection_folder):
-                os.makedirs(collection_folder)
+            os.makedirs(collection_folder, exist_ok=True)
             
-            # Export each entity
-            exported_files = []
             metadata = {
                 'collection_name': collection_name,
                 'export_date': time.strftime('%Y-%m-%d %H:%M:%S'),
@@ -319,43 +649,67 @@ class EntityExportDialog(QDialog):
                 'entities': []
             }
             
-            for i, entity in enumerate(self.selected_entities):
-                # Create safe filename
-                safe_name = self.create_safe_filename(entity.name)
-                xml_filename = f"{safe_name}_{i+1:03d}.xml"
-                xml_path = os.path.join(collection_folder, xml_filename)
-                
-                # Export entity to XML
-                success = self.export_entity_to_xml(entity, xml_path)
-                
-                if success:
-                    exported_files.append(xml_filename)
-                    
-                    # Add to metadata
-                    entity_metadata = {
-                        'name': entity.name,
-                        'id': entity.id,
-                        'filename': xml_filename,
-                        'original_position': {
-                            'x': entity.x,
-                            'y': entity.y,
-                            'z': entity.z
-                        }
-                    }
-                    
-                    if self.include_metadata_check.isChecked():
-                        entity_metadata.update({
-                            'source_file': getattr(entity, 'source_file', None),
-                            'source_file_path': getattr(entity, 'source_file_path', None),
-                            'map_name': getattr(entity, 'map_name', None)
-                        })
-                    
-                    metadata['entities'].append(entity_metadata)
+            # Export the entities on a worker thread so the dialog stays responsive
+            progress = QProgressDialog("Exporting entities...", "Cancel", 0, len(self.selected_entities), self)
+            progress.setWindowModality(Qt.WindowModality.WindowModal)
+            progress.setMinimumDuration(0)
+            
+            self.export_worker = EntityExportWorker(
+                self, self.selected_entities, collection_folder,
+                metadata['preserve_positions'], metadata['include_metadata']
+            )
+            
+            def on_complete(exported_entities):
+                progress.close()
+                metadata['entities'] = exported_entities
+                self.finish_export(collection_folder, metadata)
+            
+            def on_error(msg):
+                progress.close()
+                self.export_button.setEnabled(True)
+                QMessageBox.critical(self, "Export Error", 
+                                   f"Failed to export entities: {msg}")
+            
+            def on_cancelled(written_count):
+                progress.close()
+                self.export_button.setEnabled(True)
+                QMessageBox.information(self, "Export Cancelled",
+                                        f"Export cancelled - {written_count} entity files were written to:\n"
+                                        f"{collection_folder}\n\n"
+                                        f"No collection metadata or README was created.")
+            
+            def on_cancel():
+                self.export_worker.should_stop = True
+            
+            self.export_worker.progress_updated.connect(progress.setValue)
+            self.export_worker.export_complete.connect(on_complete)
+            self.export_worker.export_cancelled.connect(on_cancelled)
+            self.export_worker.error_occurred.connect(on_error)
+            progress.canceled.connect(on_cancel)
+            
+            self.export_button.setEnabled(False)
+            self.export_worker.start()
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Export Error", 
+                               f"Failed to export entities: {str(e)}")
+            import traceback
+            traceback.print_exc()
+    
+    def finish_export(self, collection_folder, metadata):
+        """Write the collection metadata and README once the worker is done"""
+        try:
+            collection_name = metadata['collection_name']
+            exported_files = [entity_info['filename'] for entity_info in metadata['entities']]
             
             # Save collection metadata
             metadata_path = os.path.join(collection_folder, "collection_info.json")
             with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+                if len(metadata['entities']) > COMPACT_METADATA_THRESHOLD:
+                    # Large collections: compact output on the encoder's fast path
+                    json.dump(metadata, f, separators=(',', ':'))
+                else:
+                    json.dump(metadata, f, indent=2, ensure_ascii=False)
             
             # Create a readme file
             readme_path = os.path.join(collection_folder, "README.txt")
@@ -383,22 +737,28 @@ class EntityExportDialog(QDialog):
             self.accept()
             
         except Exception as e:
+            self.export_button.setEnabled(True)
             QMessageBox.critical(self, "Export Error", 
                                f"Failed to export entities: {str(e)}")
             import traceback
             traceback.print_exc()
     
-    def export_entity_to_xml(self, entity, xml_path):
-        """Export a single entity to an XML file"""
+    def export_entity_to_xml(self, entity, xml_path, preserve_positions=None):
+        """Export a single entity to an XML file
+        
+        preserve_positions defaults to the checkbox state; the export worker
+        passes it explicitly so it never touches widgets off the UI thread.
+        """
+        if preserve_positions is None:
+            preserve_positions = self.preserve_positions_check.isChecked()
+        
         try:
             # Create a clean copy of the entity's XML element
             if hasattr(entity, 'xml_element') and entity.xml_element is not None:
-                # Make a deep copy of the XML element
-                import copy
                 xml_copy = copy.deepcopy(entity.xml_element)
                 
                 # Update the position fields to current entity position if preserve_positions is checked
-                if self.preserve_positions_check.isChecked():
+                if preserve_positions:
                     XMLHelper.update_entity_position(xml_copy, entity.x, entity.y, entity.z)
                 
                 # Export the clean entity XML directly (no wrapper)
@@ -419,29 +779,14 @@ class EntityExportDialog(QDialog):
     def write_xml_with_custom_formatting(self, element, xml_path):
         """Write XML with custom formatting - no declaration, 2-space indentation"""
         try:
-            # Convert element to string with proper formatting
-            import xml.dom.minidom
-            
-            # First convert to string using ElementTree
-            rough_string = ET.tostring(element, encoding='unicode')
-            
-            # Parse with minidom for pretty printing
-            dom = xml.dom.minidom.parseString(rough_string)
+            # Indent in place (Python 3.9+) - the element is already a copy
+            ET.indent(element, space="  ")
+            element.tail = None
             
-            # Get the pretty printed string with 2-space indentation
-            pretty_xml = dom.documentElement.toprettyxml(indent="  ")
-            
-            # Remove the extra XML declaration that minidom adds
-            lines = pretty_xml.split('\n')
-            if lines[0].startswith('<?xml'):
-                lines = lines[1:]
-            
-            # Remove empty lines and rejoin
-            clean_lines = [line for line in lines if line.strip()]
-            
-            # Write to file with clean formatting
-            with open(xml_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(clean_lines))
+            # 64 KiB buffer so each file goes out in a few large writes
+            tree = ET.ElementTree(element)
+            with open(xml_path, 'wb', buffering=65536) as f:
+                tree.write(f, encoding='utf-8', xml_declaration=False)
             
         except Exception as e:
             print(f"Error in custom XML formatting: {e}")
@@ -451,22 +796,13 @@ class EntityExportDialog(QDialog):
                         
     def is_valid_folder_name(self, name):
         """Check if the folder name is valid"""
-        invalid_chars = '<>:"/\\|?*'
-        return not any(char in name for char in invalid_chars) and len(name) > 0
+        return len(name) > 0 and _INVALID_FILENAME_CHARS.isdisjoint(name)
     
     def create_safe_filename(self, entity_name):
         """Create a safe filename from entity name"""
-        # Remove or replace invalid filename characters
-        safe_name = entity_name
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            safe_name = safe_name.replace(char, '_')
-        
-        # Remove multiple underscores and clean up
-        while '__' in safe_name:
-            safe_name = safe_name.replace('__', '_')
-        
-        safe_name = safe_name.strip('_')
+        # Replace invalid filename characters and collapse repeated underscores
+        safe_name = entity_name.translate(_SANITIZE_FILENAME)
+        safe_name = _COLLAPSE_UNDERSCORES.sub('_', safe_name).strip('_')
         
         # Ensure it's not empty
         if not safe_name:
@@ -478,13 +814,19 @@ class EntityExportDialog(QDialog):
 class EntityImportDialog(QDialog):
     """Dialog for importing entities from XML files"""
     
-    def __init__(self, parent):
+    def __init__(self, parent, exists_cache=None):
         super().__init__(parent)
         self.parent_editor = parent
         self.objects_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "objects")
+        # path -> os.path.exists result, shared with show_entity_import_dialog
+        self._exists_cache = exists_cache if exists_cache is not None else {}
         self.selected_collection = None
         self.collection_metadata = None
         self.entities_to_import = []
+        self._missionlayer_cache = {}  # sector path -> (tree, MissionLayer elements, {PathId: layer})
+        self._id_allocator = None  # [existing IDs, next candidate] for the current batch
+        self._dirty_sectors = set()  # Sector files staged but not yet written
+        self.debug = False  # Per-entity/per-sector console output
         
         self.setWindowTitle("Import Entities")
         self.setModal(True)
@@ -587,46 +929,43 @@ class EntityImportDialog(QDialog):
         self.entities_list.clear()
         
         # Find all XML files
-        xml_files = [f for f in os.listdir(collection_path) 
-                     if f.endswith('.xml') and f != 'collection_info.json']
+        with os.scandir(collection_path) as entries:
+            xml_entries = [(e.name, e.path) for e in entries
+                           if e.name.endswith('.xml') and e.is_file()]
         
-        for xml_file in xml_files:
-            xml_path = os.path.join(collection_path, xml_file)
-            
-            try:
-                # Parse the exported XML (clean format)
-                tree = ET.parse(xml_path)
-                root = tree.getroot()
-                
-                # Extract entity information using XMLHelper
-                entity_name = XMLHelper.extract_entity_name(root)
-                entity_id = XMLHelper.extract_entity_id(root)
-                x, y, z = XMLHelper.extract_position_from_xml(root)
-                
-                position_text = f"({x:.1f}, {y:.1f}, {z:.1f})"
-                item_text = f"{entity_name} - {position_text}"
-                
-                list_item = QListWidgetItem(item_text)
-                list_item.setData(Qt.ItemDataRole.UserRole, {
-                    'xml_path': xml_path,
-                    'name': entity_name,
-                    'id': entity_id,
-                    'position': position_text,
-                    'xml_element': root
-                })
-                list_item.setSelected(True)
-                self.entities_list.addItem(list_item)
+        # Hold repaints until the whole collection has been added
+        self.entities_list.setUpdatesEnabled(False)
+        try:
+            for xml_file, xml_path in xml_entries:
+                try:
+                    # Preview only - the full tree is parsed on import
+                    entity_name, entity_id, x, y, z = XMLHelper.preview_entity_file(xml_path)
                     
-            except Exception as e:
-                print(f"Error loading entity from {xml_file}: {e}")
-                list_item = QListWidgetItem(f"{xml_file} (Error loading)")
-                list_item.setData(Qt.ItemDataRole.UserRole, {
-                    'xml_path': xml_path,
-                    'name': xml_file,
-                    'id': 'unknown',
-                    'error': str(e)
-                })
-                self.entities_list.addItem(list_item)
+                    position_text = f"({x:.1f}, {y:.1f}, {z:.1f})"
+                    item_text = f"{entity_name} - {position_text}"
+                    
+                    list_item = QListWidgetItem(item_text)
+                    list_item.setData(Qt.ItemDataRole.UserRole, {
+                        'xml_path': xml_path,
+                        'name': entity_name,
+                        'id': entity_id,
+                        'position': position_text
+                    })
+                    list_item.setSelected(True)
+                    self.entities_list.addItem(list_item)
+                
+                except Exception as e:
+                    print(f"Error loading entity from {xml_file}: {e}")
+                    list_item = QListWidgetItem(f"{xml_file} (Error loading)")
+                    list_item.setData(Qt.ItemDataRole.UserRole, {
+                        'xml_path': xml_path,
+                        'name': xml_file,
+                        'id': 'unknown',
+                        'error': str(e)
+                    })
+                    self.entities_list.addItem(list_item)
+        finally:
+            self.entities_list.setUpdatesEnabled(True)
 
     def import_single_entity(self, item, sector_file_path):
         """Import a single entity by copying its XML directly into the sector file"""
@@ -634,19 +973,19 @@ class EntityImportDialog(QDialog):
             entity_data = item.data(Qt.ItemDataRole.UserRole)
             xml_path = entity_data['xml_path']
             
-            # Read the exported XML file directly
+            # Read the exported XML file directly - the freshly parsed tree
+            # is not shared with anything, so it can be modified in place
             tree = ET.parse(xml_path)
             entity_xml = tree.getroot()
             
-            # Make a deep copy to avoid modifying the original
-            import copy
-            entity_xml = copy.deepcopy(entity_xml)
+            # Locate the ID/position fields once for all the updates below
+            fields = XMLHelper.scan_entity(entity_xml)
             
             # Generate new unique ID
             new_id = self.generate_unique_entity_id()
             
             # Update the entity ID in the XML
-            if not XMLHelper.update_entity_id(entity_xml, new_id):
+            if not XMLHelper.update_entity_id(entity_xml, new_id, fields):
                 print("Warning: Could not update entity ID")
             
             # Update position if using cursor position
@@ -658,10 +997,10 @@ class EntityImportDialog(QDialog):
                 else:
                     x = y = z = 0.0
                 
-                XMLHelper.update_entity_position(entity_xml, x, y, z)
+                XMLHelper.update_entity_position(entity_xml, x, y, z, fields)
             
-            # Add the entity XML directly to the sector file
-            success = self.add_entity_xml_to_sector(entity_xml, sector_file_path)
+            # Add the entity XML to the sector - written once the batch is done
+            success = self._stage_entity_in_sector(entity_xml, sector_file_path)
             if not success:
                 return False, None
             
@@ -669,7 +1008,7 @@ class EntityImportDialog(QDialog):
             entity_name = entity_data['name']
             
             # Get final position from the XML
-            x, y, z = XMLHelper.extract_position_from_xml(entity_xml)
+            x, y, z = XMLHelper.extract_position_from_xml(entity_xml, fields)
             
             entity = Entity(
                 id=str(new_id),
@@ -682,7 +1021,8 @@ class EntityImportDialog(QDialog):
             entity.source_file = "worldsectors"
             entity.source_file_path = sector_file_path
             
-            print(f"✓ Successfully imported {entity_name} to {os.path.basename(sector_file_path)}")
+            if self.debug:
+                print(f"✓ Successfully imported {entity_name} to {os.path.basename(sector_file_path)}")
             return True, entity
             
         except Exception as e:
@@ -693,28 +1033,48 @@ class EntityImportDialog(QDialog):
 
     def generate_unique_entity_id(self):
         """Generate a unique entity ID"""
-        # Try to use parent editor's method if available
-        if hasattr(self.parent_editor, 'generate_new_entity_id'):
-            return self.parent_editor.generate_new_entity_id()
-        
-        # Fallback: generate based on existing entities
-        existing_ids = set()
-        if hasattr(self.parent_editor, 'entities'):
-            for entity in self.parent_editor.entities:
-                try:
-                    existing_ids.add(int(entity.id))
-                except:
-                    pass
+        # Try to use parent editor's method if available - unless it is the
+        # generic one installed by setup_entity_export_import_system, which
+        # the batch allocator below replaces
+        generator = getattr(self.parent_editor, 'generate_new_entity_id', None)
+        if generator is not None and getattr(generator, '__func__', None) is not _generate_new_entity_id:
+            return generator()
+        
+        # Fallback: generate based on existing entities. The ID set is built
+        # once per import batch and the cursor only moves forward, so IDs
+        # handed out earlier in the batch are never reused
+        if self._id_allocator is None:
+            existing_ids = set()
+            if hasattr(self.parent_editor, 'entities'):
+                for entity in self.parent_editor.entities:
+                    try:
+                        existing_ids.add(int(entity.id))
+                    except:
+                        pass
+            
+            # Start from a high number to avoid conflicts
+            self._id_allocator = [existing_ids, 900000]
         
-        # Start from a high number to avoid conflicts
-        new_id = 900000
+        existing_ids, new_id = self._id_allocator
         while new_id in existing_ids:
             new_id += 1
         
+        existing_ids.add(new_id)
+        self._id_allocator[1] = new_id + 1
         return new_id
 
     def add_entity_xml_to_sector(self, entity_xml, sector_file_path):
-        """Add entity XML to MissionLayer - prefers 'outside_entity', falls back to 'main'"""
+        """Add entity XML to MissionLayer and save the sector file immediately"""
+        if not self._stage_entity_in_sector(entity_xml, sector_file_path):
+            return False
+        return self._flush_dirty_sectors()
+    
+    def _stage_entity_in_sector(self, entity_xml, sector_file_path):
+        """Add entity XML to MissionLayer - prefers 'outside_entity', falls back to 'main'
+        
+        Only the in-memory tree is modified; the sector is recorded as dirty
+        and written by _flush_dirty_sectors(), once per file per import batch.
+        """
         try:
             # Load the target file if not already loaded
             if not hasattr(self.parent_editor, 'worldsectors_trees'):
@@ -731,119 +1091,92 @@ class EntityImportDialog(QDialog):
             tree = self.parent_editor.worldsectors_trees[sector_file_path]
             root = tree.getroot()
             
-            # Find ALL MissionLayers
-            mission_layers = root.findall(".//object[@name='MissionLayer']")
+            # Find ALL MissionLayers and index them by PathId - cached per tree,
+            # since inserting entities never adds layers and a bulk import hits
+            # the same sector repeatedly
+            cached = self._missionlayer_cache.get(sector_file_path)
+            if cached is not None and cached[0] is tree:
+                mission_layers, layer_by_id = cached[1], cached[2]
+            else:
+                mission_layers = root.findall(".//object[@name='MissionLayer']")
+                layer_by_id = {}
+                for mission_layer in mission_layers:
+                    # text_PathId field (FCBConverter format), then Dunia Tools value element
+                    path_id_field = mission_layer.find("field[@name='text_PathId']")
+                    path_id = path_id_field.get('value-String') if path_id_field is not None else None
+                    if not path_id:
+                        path_id_elem = mission_layer.find("value[@name='text_PathId']")
+                        path_id = path_id_elem.text if path_id_elem is not None else None
+                    if path_id and path_id not in layer_by_id:
+                        layer_by_id[path_id] = mission_layer
+                self._missionlayer_cache[sector_file_path] = (tree, mission_layers, layer_by_id)
             if not mission_layers:
                 print(f"No MissionLayer found in {sector_file_path}")
                 return False
             
-            print(f"Found {len(mission_layers)} MissionLayer(s) in file")
+            if self.debug:
+                print(f"Found {len(mission_layers)} MissionLayer(s) in file")
             
-            # Search for MissionLayers - try "outside_entity" first, then "main"
+            # Pick the MissionLayer - "outside_entity" first, then "main"
             target_mission_layer = None
             target_path_id = None
             
-            for preferred_id in ["outside_entity", "main"]:
-                for mission_layer in mission_layers:
-                    # Check text_PathId field (FCBConverter format)
-                    path_id_field = mission_layer.find("field[@name='text_PathId']")
-                    if path_id_field is not None:
-                        path_id_value = path_id_field.get('value-String', '')
-                        if path_id_value == preferred_id:
-                            target_mission_layer = mission_layer
-                            target_path_id = preferred_id
-                            print(f"✅ Found target MissionLayer: {preferred_id}")
-                            break
-                    
-                    # Also check Dunia Tools format (value element)
-                    path_id_elem = mission_layer.find("value[@name='text_PathId']")
-                    if path_id_elem is not None:
-                        path_id_value = path_id_elem.text or ''
-                        if path_id_value == preferred_id:
-                            target_mission_layer = mission_layer
-                            target_path_id = preferred_id
-                            print(f"✅ Found target MissionLayer: {preferred_id}")
-                            break
-                
-                # If we found a layer, stop searching
+            for preferred_id in ("outside_entity", "main"):
+                target_mission_layer = layer_by_id.get(preferred_id)
                 if target_mission_layer is not None:
+                    target_path_id = preferred_id
+                    if self.debug:
+                        print(f"✅ Found target MissionLayer: {preferred_id}")
                     break
             
             if target_mission_layer is None:
                 print(f"❌ No MissionLayer with PathId='outside_entity' or 'main' found in {sector_file_path}")
                 print(f"Available MissionLayers:")
-                for ml in mission_layers:
-                    path_field = ml.find("field[@name='text_PathId']")
-                    if path_field is not None:
-                        print(f"  - {path_field.get('value-String', 'unknown')}")
-                    else:
-                        path_elem = ml.find("value[@name='text_PathId']")
-                        if path_elem is not None:
-                            print(f"  - {path_elem.text or 'unknown'}")
+                for path_id in layer_by_id:
+                    print(f"  - {path_id}")
                 return False
             
             # Count existing entities BEFORE adding
             existing_entities = target_mission_layer.findall("object[@name='Entity']")
-            print(f"MissionLayer '{target_path_id}' currently has {len(existing_entities)} entities")
+            if self.debug:
+                print(f"MissionLayer '{target_path_id}' currently has {len(existing_entities)} entities")
             
-            # CRITICAL FIX: Create truly independent copy by converting to string and parsing back
-            print(f"🔧 Creating independent copy of entity XML...")
-            xml_string = ET.tostring(entity_xml, encoding='unicode')
-            entity_copy = ET.fromstring(xml_string)
+            # Only Entity objects are counted as layer entities
+            if entity_xml.tag != 'object' or entity_xml.get('name') != 'Entity':
+                print(f"❌ Entity was not added correctly!")
+                print(f"Expected an Entity object, got: {entity_xml.tag}, name={entity_xml.get('name', 'N/A')}")
+                return False
+            
+            # CRITICAL FIX: Create a truly independent copy of the entity XML
+            entity_copy = copy.deepcopy(entity_xml)
             
             # IMPORTANT: Insert the entity at the END of the MissionLayer's children
-            # Find the last Entity index to insert after all other entities
-            last_entity_index = -1
-            for i, child in enumerate(target_mission_layer):
-                if child.tag == 'object' and child.get('name') == 'Entity':
-                    last_entity_index = i
-            
-            if last_entity_index >= 0:
-                # Insert after the last entity
-                insert_position = last_entity_index + 1
-                print(f"🔧 Inserting entity at position {insert_position} (after last entity)")
-                target_mission_layer.insert(insert_position, entity_copy)
-            else:
+            # (after the last Entity). existing_entities is in document order.
+            if not existing_entities:
                 # No entities yet, append at end
-                print(f"🔧 Appending entity (first entity in layer)")
+                if self.debug:
+                    print(f"🔧 Appending entity (first entity in layer)")
                 target_mission_layer.append(entity_copy)
+            elif target_mission_layer[-1] is existing_entities[-1]:
+                # Common case - the last child is already an Entity
+                if self.debug:
+                    print(f"🔧 Appending entity (after last entity)")
+                target_mission_layer.append(entity_copy)
+            else:
+                # Trailing non-Entity children - insert after the last entity
+                insert_position = list(target_mission_layer).index(existing_entities[-1]) + 1
+                if self.debug:
+                    print(f"🔧 Inserting entity at position {insert_position} (after last entity)")
+                target_mission_layer.insert(insert_position, entity_copy)
             
-            # Verify the entity was added correctly
-            new_entities = target_mission_layer.findall("object[@name='Entity']")
-            print(f"MissionLayer '{target_path_id}' now has {len(new_entities)} entities")
-            
-            if len(new_entities) <= len(existing_entities):
-                print(f"❌ Entity was not added correctly!")
-                print(f"Expected: {len(existing_entities) + 1}, Got: {len(new_entities)}")
-                
-                # Debug: Check what's in the MissionLayer
-                print(f"🔍 Debug - MissionLayer children:")
-                for i, child in enumerate(target_mission_layer):
-                    print(f"  {i}: {child.tag}, name={child.get('name', 'N/A')}")
-                
-                return False
-            
-            print(f"✅ Successfully added entity to '{target_path_id}' MissionLayer")
-            
-            # CRITICAL: Use indent() to properly format the XML before saving
-            print(f"🔧 Formatting XML with proper indentation...")
-            try:
-                # Python 3.9+ has indent() built-in
-                ET.indent(tree, space="  ")
-            except AttributeError:
-                # Fallback for older Python versions - manual indentation
-                self._indent_xml_tree(root)
-            
-            # Save the file immediately
-            print(f"💾 Writing to file: {sector_file_path}")
-            tree.write(sector_file_path, encoding='utf-8', xml_declaration=True)
-            print(f"💾 Saved {os.path.basename(sector_file_path)}")
-            
-            # Mark as modified
-            if not hasattr(self.parent_editor, 'worldsectors_modified'):
-                self.parent_editor.worldsectors_modified = {}
-            self.parent_editor.worldsectors_modified[sector_file_path] = True
+            # The layer grew by exactly one - only re-count when debugging
+            if self.debug:
+                new_entities = target_mission_layer.findall("object[@name='Entity']")
+                print(f"MissionLayer '{target_path_id}' now has {len(new_entities)} entities "
+                      f"(expected {len(existing_entities) + 1})")
+                print(f"✅ Successfully added entity to '{target_path_id}' MissionLayer")
             
+            self._dirty_sectors.add(sector_file_path)
             return True
             
         except Exception as e:
@@ -851,22 +1184,100 @@ class EntityImportDialog(QDialog):
             import traceback
             traceback.print_exc()
             return False
+    
+    def _flush_dirty_sectors(self):
+        """Format and write every sector modified since the last flush
+        
+        Sectors that fail to save stay dirty and are retried by the next flush.
+        """
+        success = True
+        saved = []
+        
+        for sector_file_path in sorted(self._dirty_sectors):
+            try:
+                tree = self.parent_editor.worldsectors_trees[sector_file_path]
+                
+                # CRITICAL: Use indent() to properly format the XML before saving
+                if self.debug:
+                    print(f"🔧 Formatting XML with proper indentation...")
+                try:
+                    # Python 3.9+ has indent() built-in
+                    ET.indent(tree, space="  ")
+                except AttributeError:
+                    # Fallback for older Python versions - manual indentation
+                    self._indent_xml_tree(tree.getroot())
+                
+                # Write through a 1 MiB buffer to a temp file, then swap it in so
+                # a failed write never leaves a truncated sector behind
+                if self.debug:
+                    print(f"💾 Writing to file: {sector_file_path}")
+                temp_path = sector_file_path + ".tmp"
+                try:
+                    with open(temp_path, 'wb', buffering=SECTOR_WRITE_BUFFER_SIZE) as f:
+                        tree.write(f, encoding='utf-8', xml_declaration=True)
+                    os.replace(temp_path, sector_file_path)
+                except BaseException:
+                    # Don't leave a half-written temp file next to the game data
+                    try:
+                        os.remove(temp_path)
+                    except OSError:
+                        pass
+                    raise
+                saved.append(sector_file_path)
+                print(f"💾 Saved {os.path.basename(sector_file_path)}")
+                
+                # Mark as modified
+                if not hasattr(self.parent_editor, 'worldsectors_modified'):
+                    self.parent_editor.worldsectors_modified = {}
+                self.parent_editor.worldsectors_modified[sector_file_path] = True
+                
+            except Exception as e:
+                print(f"❌ Error saving sector {sector_file_path}: {e}")
+                import traceback
+                traceback.print_exc()
+                success = False
+        
+        self._dirty_sectors.difference_update(saved)
+        return success
 
     def _indent_xml_tree(self, elem, level=0):
-        """Fallback XML indentation for Python < 3.9"""
-        i = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-            for child in elem:
-                self._indent_xml_tree(child, level + 1)
-            if not child.tail or not child.tail.strip():
-                child.tail = i
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = i
+        """Fallback XML indentation for Python < 3.9
+        
+        Iterative (explicit stack) so deep sector trees do not recurse, with
+        the indent strings built once per depth.
+        """
+        indents = ["\n"]
+        def indent(depth):
+            while len(indents) <= depth:
+                indents.append(indents[-1] + "  ")
+            return indents[depth]
+        
+        def enter(node, depth):
+            if len(node):
+                if not node.text or not node.text.strip():
+                    node.text = indent(depth + 1)
+                if not node.tail or not node.tail.strip():
+                    node.tail = indent(depth)
+            elif depth and (not node.tail or not node.tail.strip()):
+                node.tail = indent(depth)
+        
+        enter(elem, level)
+        stack = [(elem, level, iter(elem))]
+        while stack:
+            node, depth, children = stack[-1]
+            child = next(children, None)
+            if child is not None:
+                enter(child, depth + 1)
+                if len(child):
+                    stack.append((child, depth + 1, iter(child)))
+                continue
+            
+            # All children done - the last one closes back at this depth
+            stack.pop()
+            if len(node):
+                last = node[-1]
+                if not last.tail or not last.tail.strip():
+                    last.tail = indent(depth)
 
     def load_collections(self):
         """Load available entity collections"""
@@ -878,33 +1289,43 @@ class EntityImportDialog(QDialog):
         
         collections_found = 0
         
-        for item in os.listdir(self.objects_folder):
-            item_path = os.path.join(self.objects_folder, item)
-            if os.path.isdir(item_path):
-                # Check if it's a valid collection
-                metadata_path = os.path.join(item_path, "collection_info.json")
-                xml_files = [f for f in os.listdir(item_path) if f.endswith('.xml')]
+        with os.scandir(self.objects_folder) as entries:
+            collection_entries = [entry for entry in entries if entry.is_dir()]
+        
+        for entry in collection_entries:
+            item = entry.name
+            item_path = entry.path
+            
+            # Check if it's a valid collection - one directory read for both checks
+            metadata_path = os.path.join(item_path, "collection_info.json")
+            has_metadata = False
+            xml_files = []
+            with os.scandir(item_path) as sub_entries:
+                for sub_entry in sub_entries:
+                    if sub_entry.name == "collection_info.json":
+                        has_metadata = True
+                    elif sub_entry.name.endswith('.xml'):
+                        xml_files.append(sub_entry.name)
+            
+            if has_metadata or xml_files:
+                collections_found += 1
                 
-                if os.path.exists(metadata_path) or xml_files:
-                    collections_found += 1
-                    
-                    # Create list item with collection info
-                    if os.path.exists(metadata_path):
-                        try:
-                            with open(metadata_path, 'r', encoding='utf-8') as f:
-                                metadata = json.load(f)
-                            
-                            item_text = f"{item} ({metadata.get('entity_count', len(xml_files))} entities)"
-                            export_date = metadata.get('export_date', 'Unknown date')
-                            item_text += f" - {export_date}"
-                        except:
-                            item_text = f"{item} ({len(xml_files)} entities)"
-                    else:
+                # Create list item with collection info
+                if has_metadata:
+                    try:
+                        metadata = _load_collection_metadata(metadata_path)
+                        
+                        item_text = f"{item} ({metadata.get('entity_count', len(xml_files))} entities)"
+                        export_date = metadata.get('export_date', 'Unknown date')
+                        item_text += f" - {export_date}"
+                    except:
                         item_text = f"{item} ({len(xml_files)} entities)"
-                    
-                    list_item = QListWidgetItem(item_text)
-                    list_item.setData(Qt.ItemDataRole.UserRole, item_path)
-                    self.collections_list.addItem(list_item)
+                else:
+                    item_text = f"{item} ({len(xml_files)} entities)"
+                
+                list_item = QListWidgetItem(item_text)
+                list_item.setData(Qt.ItemDataRole.UserRole, item_path)
+                self.collections_list.addItem(list_item)
         
         if collections_found == 0:
             self.status_label.setText("No entity collections found in objects folder.")
@@ -917,66 +1338,77 @@ class EntityImportDialog(QDialog):
         self.sector_combo.addItem("-- Select Target Sector --")
         
         sectors_added = 0
+        from_trees = from_entities = from_folder = 0
+        # Normalized paths already in the combo, shared by all three methods
         existing_paths = set()
+        def _path_key(path):
+            return os.path.normcase(os.path.normpath(path))
+        
+        # Memoize existence checks - many entities share the same sector file,
+        # and show_entity_import_dialog has usually stat'ed them already
+        exists_cache = self._exists_cache
+        def _exists(path):
+            if path not in exists_cache:
+                exists_cache[path] = os.path.exists(path)
+            return exists_cache[path]
         
         # Method 1: Check worldsectors_trees (loaded XML files)
         if hasattr(self.parent_editor, 'worldsectors_trees') and self.parent_editor.worldsectors_trees:
-            print(f"Found {len(self.parent_editor.worldsectors_trees)} loaded worldsector trees")
             for file_path in self.parent_editor.worldsectors_trees.keys():
                 filename = os.path.basename(file_path)
                 if 'worldsector' in filename:
                     # Extract sector number
-                    import re
-                    match = re.search(r'worldsector(\d+)', filename)
+                    match = _WORLDSECTOR_RE.search(filename)
                     if match:
                         sector_num = match.group(1)
                         display_name = f"Sector {sector_num} ({filename})"
                         self.sector_combo.addItem(display_name, file_path)
-                        existing_paths.add(file_path)
+                        existing_paths.add(_path_key(file_path))
                         sectors_added += 1
-                        print(f"Added sector from trees: {display_name}")
+                        from_trees += 1
+                        if self.debug:
+                            print(f"Added sector from trees: {display_name}")
         
         # Method 2: Check entities for their source files
-        sectors_from_entities = set()
-        if hasattr(self.parent_editor, 'entities'):
-            for entity in self.parent_editor.entities:
-                source_file = getattr(entity, 'source_file_path', None)
-                if source_file and 'worldsector' in source_file and os.path.exists(source_file):
-                    sectors_from_entities.add(source_file)
+        sectors_from_entities = _get_worldsector_sources(self.parent_editor, _exists)
         
         # Add any sectors we found from entities that aren't already loaded
         for sector_file in sectors_from_entities:
-            if sector_file not in existing_paths:
+            if _path_key(sector_file) not in existing_paths:
                 filename = os.path.basename(sector_file)
-                import re
-                match = re.search(r'worldsector(\d+)', filename)
+                match = _WORLDSECTOR_RE.search(filename)
                 if match:
                     sector_num = match.group(1)
                     display_name = f"Sector {sector_num} ({filename}) [From entities]"
                     self.sector_combo.addItem(display_name, sector_file)
-                    existing_paths.add(sector_file)
+                    existing_paths.add(_path_key(sector_file))
                     sectors_added += 1
-                    print(f"Added sector from entities: {display_name}")
+                    from_entities += 1
+                    if self.debug:
+                        print(f"Added sector from entities: {display_name}")
         
         # Method 3: Check worldsectors_path for .converted.xml files
-        if hasattr(self.parent_editor, 'worldsectors_path') and self.parent_editor.worldsectors_path:
-            worldsectors_path = self.parent_editor.worldsectors_path
-            if os.path.exists(worldsectors_path):
-                for file in os.listdir(worldsectors_path):
-                    if file.endswith('.converted.xml') and 'worldsector' in file:
-                        file_path = os.path.join(worldsectors_path, file)
-                        if file_path not in existing_paths:
-                            import re
-                            match = re.search(r'worldsector(\d+)', file)
+        worldsectors_path = getattr(self.parent_editor, 'worldsectors_path', None)
+        if worldsectors_path:
+            if _exists(worldsectors_path):
+                with os.scandir(worldsectors_path) as entries:
+                    sector_entries = [(entry.name, entry.path) for entry in entries]
+                for file, file_path in sector_entries:
+                    if _is_worldsector_file(file):
+                        if _path_key(file_path) not in existing_paths:
+                            match = _WORLDSECTOR_RE.search(file)
                             if match:
                                 sector_num = match.group(1)
                                 display_name = f"Sector {sector_num} ({file}) [Available]"
                                 self.sector_combo.addItem(display_name, file_path)
-                                existing_paths.add(file_path)
+                                existing_paths.add(_path_key(file_path))
                                 sectors_added += 1
-                                print(f"Added sector from worldsectors_path: {display_name}")
+                                from_folder += 1
+                                if self.debug:
+                                    print(f"Added sector from worldsectors_path: {display_name}")
         
-        print(f"Total sectors added to combo: {sectors_added}")
+        print(f"Total sectors added to combo: {sectors_added} "
+              f"({from_trees} loaded, {from_entities} from entities, {from_folder} from worldsectors folder)")
         
         if sectors_added == 0:
             self.sector_combo.addItem("No sectors available - load worldsectors first", None)
@@ -1012,13 +1444,9 @@ class EntityImportDialog(QDialog):
         
         # Load metadata if available
         metadata_path = os.path.join(collection_path, "collection_info.json")
-        if os.path.exists(metadata_path):
-            try:
-                with open(metadata_path, 'r', encoding='utf-8') as f:
-                    self.collection_metadata = json.load(f)
-            except:
-                self.collection_metadata = None
-        else:
+        try:
+            self.collection_metadata = _load_collection_metadata(metadata_path)
+        except:
             self.collection_metadata = None
         
         # Update collection info
@@ -1039,9 +1467,9 @@ class EntityImportDialog(QDialog):
     
     def import_entities(self):
         """Import the selected entities"""
-        # Get selected entities
-        selected_items = [self.entities_list.item(i) for i in range(self.entities_list.count()) 
-                         if self.entities_list.item(i).isSelected()]
+        # Get selected entities - in list order, not click order
+        selected_items = self.entities_list.selectedItems()
+        selected_items.sort(key=self.entities_list.row)
         
         if not selected_items:
             QMessageBox.warning(self, "No Selection", "Please select entities to import.")
@@ -1073,15 +1501,20 @@ class EntityImportDialog(QDialog):
             
             imported_entities = []
             failed_imports = []
+            self._id_allocator = None  # Rebuilt lazily for this batch
+            
+            # Repaint roughly 100 times per batch rather than once per entity
+            progress_step = max(1, len(selected_items) // 100)
             
             for i, item in enumerate(selected_items):
-                progress.setValue(i)
                 entity_name = item.data(Qt.ItemDataRole.UserRole)['name']
-                progress.setLabelText(f"Importing {entity_name}...")
-                QApplication.processEvents()
-                
-                if progress.wasCanceled():
-                    break
+                if i % progress_step == 0:
+                    progress.setValue(i)
+                    progress.setLabelText(f"Importing {entity_name}...")
+                    QApplication.processEvents()
+                    
+                    if progress.wasCanceled():
+                        break
                 
                 # Import the entity
                 success, entity = self.import_single_entity(item, sector_data)
@@ -1091,11 +1524,23 @@ class EntityImportDialog(QDialog):
                     failed_imports.append(entity_name)
             
             progress.close()
+            print(f"Imported {len(imported_entities)} entities to {os.path.basename(sector_data)}"
+                  f" ({len(failed_imports)} failed)")
+            
+            # Write each modified sector file once for the whole batch
+            sectors_saved = self._flush_dirty_sectors()
+            
+            # Entities whose sector file could not be written are not added to the editor
+            unsaved_count = 0
+            if not sectors_saved:
+                unsaved_count = len(imported_entities)
+                imported_entities = []
             
             # Update the editor
             if imported_entities:
                 # Add to main entities list
                 self.parent_editor.entities.extend(imported_entities)
+                invalidate_worldsector_sources(self.parent_editor)
                 
                 # Update canvas
                 self.parent_editor.canvas.set_entities(self.parent_editor.entities)
@@ -1117,12 +1562,16 @@ class EntityImportDialog(QDialog):
             
             # Show results
             success_msg = f"Successfully imported {len(imported_entities)} entities"
+            if not sectors_saved:
+                success_msg += (f"\n\nThe target sector file could not be saved, so {unsaved_count} "
+                                f"imported entities were not added - see the console for details.")
             if failed_imports:
                 success_msg += f"\n\nFailed to import {len(failed_imports)} entities:\n"
                 success_msg += "\n".join(failed_imports[:5])
                 if len(failed_imports) > 5:
                     success_msg += f"\n... and {len(failed_imports) - 5} more"
-                
+            
+            if failed_imports or not sectors_saved:
                 QMessageBox.warning(self, "Import Completed with Errors", success_msg)
             else:
                 QMessageBox.information(self, "Import Successful", success_msg)
@@ -1165,25 +1614,32 @@ def show_entity_import_dialog(editor):
     # Enhanced worldsector detection
     worldsectors_available = False
     
+    # Memoize existence checks - many entities share the same sector file
+    exists_cache = {}
+    def _exists(path):
+        if path not in exists_cache:
+            exists_cache[path] = os.path.exists(path)
+        return exists_cache[path]
+    
     # Check multiple sources for worldsectors
     if hasattr(editor, 'worldsectors_trees') and editor.worldsectors_trees:
         worldsectors_available = True
         print(f"Found {len(editor.worldsectors_trees)} loaded worldsector trees")
     
-    if not worldsectors_available and hasattr(editor, 'entities'):
-        # Check if any entities have worldsector source files
-        for entity in editor.entities:
-            source_file = getattr(entity, 'source_file_path', None)
-            if source_file and 'worldsector' in source_file and os.path.exists(source_file):
-                worldsectors_available = True
-                print(f"Found worldsector from entity: {source_file}")
-                break
+    if not worldsectors_available:
+        # Check if any entities have worldsector source files - the set is
+        # cached on the editor and reused by the dialog's sector list
+        sources = _get_worldsector_sources(editor, _exists)
+        if sources:
+            worldsectors_available = True
+            print(f"Found {len(sources)} worldsector(s) from entities")
     
-    if not worldsectors_available and hasattr(editor, 'worldsectors_path'):
+    worldsectors_path = getattr(editor, 'worldsectors_path', None)
+    if not worldsectors_available and worldsectors_path:
         # Check if worldsectors_path exists and has .converted.xml files
-        if editor.worldsectors_path and os.path.exists(editor.worldsectors_path):
-            for file in os.listdir(editor.worldsectors_path):
-                if file.endswith('.converted.xml') and 'worldsector' in file:
+        if _exists(worldsectors_path):
+            for file in os.listdir(worldsectors_path):
+                if _is_worldsector_file(file):
                     worldsectors_available = True
                     print(f"Found worldsector file: {file}")
                     break
@@ -1208,63 +1664,77 @@ def show_entity_import_dialog(editor):
         else:
             return
     
-    # Show import dialog
-    dialog = EntityImportDialog(editor)
+    # Show import dialog - hand over the stat results gathered above
+    dialog = EntityImportDialog(editor, exists_cache)
     dialog.exec()
 
+def _generate_new_entity_id(editor):
+    """Generate a new unique entity ID - installed on editors that lack their own"""
+    existing_ids = set()
+    for entity in editor.entities:
+        try:
+            existing_ids.add(int(entity.id))
+        except:
+            pass
+    
+    # Start from a high number to avoid conflicts
+    new_id = 900000
+    while new_id in existing_ids:
+        new_id += 1
+    
+    return new_id
+
+
 def setup_entity_export_import_system(editor):
     """Setup the complete entity export/import system"""
     
     # Ensure objects folder exists
     objects_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "objects")
-    if not os.path.exists(objects_folder):
-        os.makedirs(objects_folder)
-        print(f"Created objects folder: {objects_folder}")
+    os.makedirs(objects_folder, exist_ok=True)
     
     # Add generate_new_entity_id method to editor if it doesn't exist
     if not hasattr(editor, 'generate_new_entity_id'):
-        def generate_new_entity_id(self):
-            """Generate a new unique entity ID"""
-            existing_ids = set()
-            for entity in self.entities:
-                try:
-                    existing_ids.add(int(entity.id))
-                except:
-                    pass
-            
-            # Start from a high number to avoid conflicts
-            new_id = 900000
-            while new_id in existing_ids:
-                new_id += 1
-            
-            return new_id
-        
         # Bind the method to the editor instance
         import types
-        editor.generate_new_entity_id = types.MethodType(generate_new_entity_id, editor)
+        editor.generate_new_entity_id = types.MethodType(_generate_new_entity_id, editor)
             
     print("✅ Entity Export/Import system setup complete")
 
 
 # Utility function to validate exported entities
 def validate_exported_entity(xml_path):
-    """Validate an exported entity XML file"""
+    """Validate an exported entity XML file
+    
+    Streams the whole file, clearing elements as it goes, so no tree is
+    built for the (possibly large) entity - but a truncated or malformed
+    file still fails with a parse error.
+    """
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        
-        # Check basic structure
-        if root.tag != "object":
-            return False, "Root element is not 'object'"
-        
-        # Check for essential fields
-        essential_fields = ['hidName', 'disEntityId', 'hidPos']
-        for field_name in essential_fields:
-            # Check both formats
-            fcb_field = root.find(f".//field[@name='{field_name}']")
-            dunia_field = root.find(f".//value[@name='{field_name}']")
-            
-            if fcb_field is None and dunia_field is None:
+        iterparse = LET.iterparse if LXML_AVAILABLE else ET.iterparse
+        wanted = set(ESSENTIAL_ENTITY_FIELDS)
+        seen = set()
+        root_checked = False
+        
+        for event, elem in iterparse(xml_path, events=('start', 'end')):
+            if event == 'end':
+                elem.clear()
+                continue
+            
+            # Check basic structure
+            if not root_checked:
+                if elem.tag != "object":
+                    return False, "Root element is not 'object'"
+                root_checked = True
+                continue
+            
+            # Check for essential fields (both formats)
+            if elem.tag == 'field' or elem.tag == 'value':
+                name = elem.get('name')
+                if name in wanted:
+                    seen.add(name)
+        
+        for field_name in ESSENTIAL_ENTITY_FIELDS:
+            if field_name not in seen:
                 return False, f"Missing essential field: {field_name}"
         
         return True, "Valid entity XML"
@@ -1284,26 +1754,38 @@ def batch_export_entities(editor, entity_list, collection_name, output_folder=No
         if not os.path.exists(collection_folder):
             os.makedirs(collection_folder)
         
-        exported_count = 0
+        def export_one(entity, xml_path):
+            xml_copy = copy.deepcopy(entity.xml_element)
+            
+            # Update position
+            XMLHelper.update_entity_position(xml_copy, entity.x, entity.y, entity.z)
+            
+            # Serialize once and write the bytes in a single call
+            data = ET.tostring(xml_copy, encoding='utf-8', xml_declaration=True)
+            with open(xml_path, 'wb') as f:
+                f.write(data)
+        
+        jobs = []
         for i, entity in enumerate(entity_list):
             # Create filename
             safe_name = entity.name.replace('/', '_').replace('\\', '_')
             xml_filename = f"{safe_name}_{i+1:03d}.xml"
             xml_path = os.path.join(collection_folder, xml_filename)
             
-            # Export entity
             if hasattr(entity, 'xml_element') and entity.xml_element is not None:
-                import copy
-                xml_copy = copy.deepcopy(entity.xml_element)
-                
-                # Update position
-                XMLHelper.update_entity_position(xml_copy, entity.x, entity.y, entity.z)
-                
-                # Write to file
-                tree = ET.ElementTree(xml_copy)
-                tree.write(xml_path, encoding='utf-8', xml_declaration=True)
-                
-                exported_count += 1
+                jobs.append((entity, xml_path))
+        
+        # Small batches aren't worth the pool start-up cost
+        if len(jobs) > BATCH_EXPORT_PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=min(EXPORT_MAX_WORKERS, len(jobs))) as executor:
+                futures = [executor.submit(export_one, entity, xml_path) for entity, xml_path in jobs]
+                for future in futures:
+                    future.result()
+        else:
+            for entity, xml_path in jobs:
+                export_one(entity, xml_path)
+        
+        exported_count = len(jobs)
         
         print(f"✓ Batch exported {exported_count} entities to {collection_folder}")
         return True, exported_count
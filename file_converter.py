@@ -1,38 +1,148 @@
-import multiprocessing
-from multiprocessing import Pool, cpu_count
-
 from cache_manager import get_cache_manager
 
 import sys
-import subprocess
 
 import os
+import re
 import subprocess
 import shutil
+import threading
 import time
-import glob
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from functools import lru_cache, partial
 from pathlib import Path
 
-# Prevent multiprocessing issues during cx_Freeze build
-if __name__ == '__main__':
-    multiprocessing.freeze_support()
+# Max .data.fcb files handed to one FCBConverter process when it takes several
+FCB_BATCH_SIZE = 64
+
+# Batches queued per worker thread - more, smaller batches let a worker that
+# finishes early pick up the next one instead of idling behind a slow batch
+FCB_BATCHES_PER_WORKER = 4
+
+# Threads used for the per-file delete/rename passes (pure filesystem calls)
+FILE_OP_MAX_WORKERS = 8
+
+# Sequential conversions that log full diagnostics, as a spot check
+VERBOSE_SPOT_CHECK_FILES = 3
+
+# Minimum seconds between progress callbacks during parallel conversion (~30 Hz)
+PROGRESS_UPDATE_INTERVAL = 1 / 30
+
+# Main level files converted by convert_folder - matched anywhere in the name
+_MAIN_FCB_TARGETS = ('.managers.fcb', 'mapsdata.fcb', '.omnis.fcb', 'sectorsdep.fcb')
+_MAIN_FCB_RE = re.compile('|'.join(re.escape(target) for target in _MAIN_FCB_TARGETS))
+
+# Converter subprocess timeout: at least CONVERTER_MIN_TIMEOUT seconds, plus
+# CONVERTER_SECONDS_PER_MB for large inputs whose output simply takes long to write
+CONVERTER_MIN_TIMEOUT = 30
+CONVERTER_SECONDS_PER_MB = 2
+
+# Converter processes started by the conversion workers, so a cancelled run
+# can kill the ones already running - see _cancel_running_converters()
+_running_converters = set()
+_running_converters_lock = threading.Lock()
+_converters_cancelled = threading.Event()
 
-# Also ensure it's called when module is imported in frozen state
-if getattr(sys, 'frozen', False):
+
+class _ConversionCancelled(Exception):
+    """A converter was killed because its conversion run was cancelled"""
+
+def _converter_timeout(input_path):
+    """Timeout in seconds for converting input_path, scaled by its size"""
     try:
-        multiprocessing.freeze_support()
-    except:
-        pass
+        size = os.path.getsize(input_path)
+    except OSError:
+        return CONVERTER_MIN_TIMEOUT
+    return max(CONVERTER_MIN_TIMEOUT, size // (1024 * 1024) * CONVERTER_SECONDS_PER_MB)
+
+def _snapshot_dir(path):
+    """Directory entries by name from a single scandir pass"""
+    with os.scandir(path) as entries:
+        return {entry.name: entry for entry in entries}
+
+def _scan_tree(path):
+    """Yield (directory, entries by name) for path and all its subdirectories
+    
+    Like os.walk (symlinked directories are not followed, unreadable ones
+    are skipped) but keeps the DirEntry objects of each listing.
+    """
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        try:
+            entries = _snapshot_dir(current)
+        except OSError:
+            continue
+        yield current, entries
+        pending.extend(entry.path for entry in entries.values() if entry.is_dir(follow_symlinks=False))
 
 class FileConverter:
     """Simplified file converter for FCBConverter tool only"""
     
-    def __init__(self, tools_path="tools"):
-        """Initialize the converter with FCBConverter tool"""
-        import sys
-        import os
+    def __init__(self, tools_path="tools", batch_conversion=None):
+        """Initialize the converter with FCBConverter tool
+        
+        batch_conversion: the converter accepts several input files per run.
+        Defaults to the FCB_BATCH environment setting and is off unless set -
+        it is never guessed.
+        """
+        # FCB_DEBUG=1 turns on converter_debug.txt and per-file diagnostics
+        debug = bool(os.environ.get('FCB_DEBUG'))
+        if batch_conversion is None:
+            batch_conversion = bool(os.environ.get('FCB_BATCH'))
+        
+        # Try the converter in multiple locations
+        converter_paths = [
+            os.path.join(tools_path, "fcbconverter.exe"),
+            os.path.join(tools_path, "FCBConverter.exe")
+        ]
+        
+        if getattr(sys, 'frozen', False):
+            exe_dir = os.path.dirname(sys.executable)
+            converter_paths.extend([
+                os.path.join(exe_dir, "tools", "fcbconverter.exe"),
+                os.path.join(exe_dir, "tools", "FCBConverter.exe"),
+                os.path.join(exe_dir, "fcbconverter.exe"),
+                os.path.join(exe_dir, "FCBConverter.exe")
+            ])
+        
+        if debug:
+            self._write_debug_info(tools_path, converter_paths)
+        
+        # Store paths for the class
+        self.tools_path = tools_path
+        # Gibbed converter for the main level files, resolved once like the FCB converter
+        self.binary_converter_path = os.path.realpath(os.path.join(tools_path, "Gibbed.Dunia.ConvertBinary.exe"))
+        self.fcb_converter_path = os.path.join(tools_path, "fcbconverter.exe")  # Default
+        
+        # Check if any converter exists
+        self.can_convert_fcb = False
+        for converter_path in converter_paths:
+            if os.path.exists(converter_path):
+                # Absolute path resolved once, so launching the converter
+                # never has to search for it again
+                self.fcb_converter_path = os.path.realpath(converter_path)
+                self.can_convert_fcb = True
+                print(f"Found FCB converter at: {converter_path}")
+                break
+        
+        self.conversion_enabled = self.can_convert_fcb
+        self.batch_conversion = batch_conversion  # Several files per converter run
+        self.debug = debug  # Verbose per-file diagnostics (directory listings etc.)
+        
+        # Worker threads shared by every conversion this session - see _get_executor()/shutdown()
+        self._executor = None
         
-        # Write debug info to a file we can check
+        if not self.can_convert_fcb:
+            print(f"WARNING: fcbconverter.exe not found")
+            print("File conversion is disabled.")
+            if debug:
+                print(f"Check converter_debug.txt for details")
+            else:
+                print("Set FCB_DEBUG=1 and restart to write converter_debug.txt")
+    
+    def _write_debug_info(self, tools_path, converter_paths):
+        """Write converter lookup details to converter_debug.txt"""
         debug_path = os.path.join(os.getcwd(), "converter_debug.txt")
         with open(debug_path, "w") as f:
             f.write(f"Frozen: {getattr(sys, 'frozen', False)}\n")
@@ -54,47 +164,12 @@ class FileConverter:
             if os.path.exists(tools_path):
                 f.write(f"Tools contents: {os.listdir(tools_path)}\n")
             
-            # Try the converter in multiple locations
-            converter_paths = [
-                os.path.join(tools_path, "fcbconverter.exe"),
-                os.path.join(tools_path, "FCBConverter.exe")
-            ]
-            
-            if getattr(sys, 'frozen', False):
-                exe_dir = os.path.dirname(sys.executable)
-                converter_paths.extend([
-                    os.path.join(exe_dir, "tools", "fcbconverter.exe"),
-                    os.path.join(exe_dir, "tools", "FCBConverter.exe"),
-                    os.path.join(exe_dir, "fcbconverter.exe"),
-                    os.path.join(exe_dir, "FCBConverter.exe")
-                ])
-            
             for i, converter_path in enumerate(converter_paths):
                 f.write(f"Converter path {i+1}: {converter_path}\n")
                 f.write(f"Converter {i+1} exists: {os.path.exists(converter_path)}\n")
-        
-        # Store paths for the class
-        self.tools_path = tools_path
-        self.fcb_converter_path = os.path.join(tools_path, "fcbconverter.exe")  # Default
-        
-        # Check if any converter exists
-        self.can_convert_fcb = False
-        for converter_path in converter_paths:
-            if os.path.exists(converter_path):
-                self.fcb_converter_path = converter_path
-                self.can_convert_fcb = True
-                print(f"Found FCB converter at: {converter_path}")
-                break
-        
-        self.conversion_enabled = self.can_convert_fcb
-        
-        if not self.can_convert_fcb:
-            print(f"WARNING: fcbconverter.exe not found")
-            print("File conversion is disabled.")
-            print(f"Check converter_debug.txt for details")
 
     def convert_data_fcb_files(self, worldsectors_path, progress_callback=None):
-        """Convert .data.fcb files to .converted.xml format with caching and optional multiprocessing"""
+        """Convert .data.fcb files to .converted.xml format with caching and optional parallel conversion"""
         if not self.conversion_enabled:
             msg = "File conversion is disabled."
             print(msg)
@@ -120,9 +195,11 @@ class FileConverter:
         
         log(f"\nScanning for .data.fcb files in: {worldsectors_path}")
         
-        # Find all .data.fcb files (no recursive search)
-        pattern = os.path.join(worldsectors_path, "*.data.fcb")
-        data_fcb_files = glob.glob(pattern)
+        # Find all .data.fcb files (no recursive search) - one directory scan,
+        # reused below for the converted XML checks
+        entries = _snapshot_dir(worldsectors_path)
+        data_fcb_files = [os.path.join(worldsectors_path, name) for name in entries
+                          if name.lower().endswith('.data.fcb')]
         
         log(f"Found {len(data_fcb_files)} .data.fcb files")
         
@@ -136,15 +213,7 @@ class FileConverter:
         
         # ============ CACHE INTEGRATION HERE ============
         # Filter out files that have valid cached conversions
-        files_to_convert = []
-        cached_count = 0
-        
-        for fcb_file in data_fcb_files:
-            if cache.is_fcb_conversion_cached(fcb_file):
-                log(f"âœ“ Using cached conversion for: {os.path.basename(fcb_file)}")
-                cached_count += 1
-            else:
-                files_to_convert.append(fcb_file)
+        files_to_convert, cached_count = cache.filter_uncached(data_fcb_files, entries)
         
         if cached_count > 0:
             log(f"Cache hit: {cached_count} files already converted (skipped)")
@@ -161,18 +230,40 @@ class FileConverter:
         log(f"Converting {len(files_to_convert)} new/modified .data.fcb files, Please Wait.")
         # ============ END CACHE INTEGRATION ============
         
-        # Use multiprocessing for multiple files, sequential for single file
-        use_multiprocessing = True
-        if use_multiprocessing and len(files_to_convert) > 1:
-            success_count, error_count, errors = self._convert_multiprocessing(files_to_convert, progress_callback, cache)
+        # Convert in parallel for multiple files, sequential for single file
+        use_parallel = True
+        if use_parallel and len(files_to_convert) > 1:
+            success_count, error_count, errors = self._convert_parallel(files_to_convert, progress_callback, cache)
         else:
             success_count, error_count, errors = self._convert_sequential(files_to_convert, progress_callback, cache)
         
-        # Save cache to disk after conversion
-        cache._save_fcb_cache()
+        # Save cache to disk after conversion - written by the cache's
+        # background thread so the caller isn't held up by it
+        cache._schedule_fcb_save()
         
         return success_count, error_count, errors
         
+    def _get_executor(self):
+        """The session's conversion threads, started on first use
+        
+        Threads pull tasks from the executor's shared queue at their own
+        pace and are only created as work needs them, so one executor sized
+        for the whole machine serves every conversion run.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="fcb-convert")
+        return self._executor
+    
+    def shutdown(self):
+        """Drop any queued conversions, kill running converters and stop the worker threads
+        
+        Call when the application exits.
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            _cancel_running_converters()
+    
     def _convert_sequential(self, files_to_convert, progress_callback, cache=None):
         """Sequential conversion with caching support"""
         success_count = 0
@@ -183,7 +274,8 @@ class FileConverter:
             try:
                 print(f"Converting ({i+1}/{len(files_to_convert)}): {os.path.basename(fcb_file)}, Please Wait.")
                 
-                if self.convert_fcb_to_converted_xml(fcb_file):
+                verbose = self.debug or i < VERBOSE_SPOT_CHECK_FILES
+                if self.convert_fcb_to_converted_xml(fcb_file, verbose=verbose):
                     success_count += 1
                     
                     # ============ CACHE INTEGRATION HERE ============
@@ -212,21 +304,20 @@ class FileConverter:
         print(f"Data FCB conversion complete: {success_count} successful, {error_count} failed")
         return success_count, error_count, errors
 
-    def _convert_multiprocessing(self, files_to_convert, progress_callback, cache=None):
-        """Parallel conversion using multiprocessing with caching and cancellation support"""
-        from multiprocessing import Pool, cpu_count
+    def _convert_parallel(self, files_to_convert, progress_callback, cache=None):
+        """Parallel conversion with caching and cancellation support
         
+        The real work happens in fcbconverter.exe processes, so the workers
+        are threads that just wait on their converter process (which releases the
+        GIL) - no worker processes to spawn, and one converter per CPU.
+        The threads persist between runs, see _get_executor().
+        """
         file_count = len(files_to_convert)
         
         # Determine optimal worker count
-        if file_count < 4:
-            num_workers = min(file_count, cpu_count() - 2)
-        else:
-            num_workers = max(2, min(cpu_count() - 2, 8))
-        
-        chunksize = 1
+        num_workers = max(1, min(file_count, os.cpu_count() or 1))
         
-        msg = f"Using multiprocessing with {num_workers} workers (processing {file_count} files)"
+        msg = f"Using {num_workers} worker threads (processing {file_count} files)"
         print(msg)
         if progress_callback:
             try:
@@ -234,26 +325,45 @@ class FileConverter:
             except:
                 pass
         
-        # Create conversion tasks with converter path
-        tasks = [(fcb_file, self.fcb_converter_path) for fcb_file in files_to_convert]
+        # Create conversion tasks - the converter path is bound to the worker
+        # once rather than repeated in every task. Several files per converter
+        # process when it supports that
+        if self.batch_conversion:
+            batch_size = max(1, min(FCB_BATCH_SIZE, -(-file_count // (num_workers * FCB_BATCHES_PER_WORKER))))
+            tasks = [files_to_convert[i:i + batch_size] for i in range(0, file_count, batch_size)]
+            worker = partial(_convert_fcb_batch_worker, converter_path=self.fcb_converter_path)
+        else:
+            tasks = files_to_convert
+            worker = partial(_convert_fcb_single_worker, converter_path=self.fcb_converter_path)
         
         success_count = 0
         error_count = 0
         errors = []
         
         # Track timing
-        import time
         start_time = time.time()
         
-        pool = None
+        executor = self._get_executor()
+        futures = []
         cancelled = False
+        fall_back = False
+        _converters_cancelled.clear()
+        
+        # Log lines are batched into the (rate limited) progress callbacks -
+        # the UI gets one update per interval rather than one per file
+        pending_log = []
+        last_progress_time = 0.0
         
         try:
-            pool = Pool(processes=num_workers)
+            futures.extend(executor.submit(worker, task) for task in tasks)
             
-            for i, result in enumerate(pool.imap(_convert_fcb_worker, tasks, chunksize=chunksize)):
+            # Unordered - report each file as soon as it is done, so one slow
+            # file doesn't hold back the progress of the rest
+            results = (result for future in as_completed(futures)
+                       for result in future.result())
+            for i, result in enumerate(results):
                 # Create log message
-                log_msg = f"({i+1}/{len(tasks)}) "
+                log_msg = f"({i+1}/{file_count}) "
                 
                 if result.get('message'):
                     log_msg += result['message']
@@ -264,7 +374,8 @@ class FileConverter:
                     success_count += 1
                     
                     # ============ CACHE INTEGRATION HERE ============
-                    # Mark file as successfully converted in cache
+                    # Mark file as successfully converted in cache - including
+                    # files whose XML was already there (from_existing_output)
                     if cache and 'fcb_file' in result:
                         cache.mark_fcb_converted(result['fcb_file'])
                     # ============ END CACHE INTEGRATION ============
@@ -273,11 +384,16 @@ class FileConverter:
                     if result.get('error'):
                         errors.append(f"{result['filename']}: {result['error']}")
                 
-                # Update progress with log message
-                progress = (i + 1) / len(tasks)
-                if progress_callback:
+                # Update progress with log message - always for the last file
+                pending_log.append(log_msg)
+                now = time.monotonic()
+                if progress_callback and (i + 1 == file_count or now - last_progress_time >= PROGRESS_UPDATE_INTERVAL):
+                    last_progress_time = now
+                    progress = (i + 1) / file_count
+                    log_text = "\n".join(pending_log)
+                    pending_log.clear()
                     try:
-                        progress_callback(progress, log_msg)
+                        progress_callback(progress, log_text)
                     except (BrokenPipeError, ConnectionResetError, AttributeError, InterruptedError):
                         print("Cancellation detected - stopping conversion...")
                         cancelled = True
@@ -291,37 +407,28 @@ class FileConverter:
                             break
         
         except (BrokenPipeError, ConnectionResetError, EOFError) as e:
-            print(f"Multiprocessing interrupted (user cancelled): {type(e).__name__}")
+            print(f"Parallel conversion interrupted (user cancelled): {type(e).__name__}")
             cancelled = True
             
         except Exception as e:
-            print(f"Multiprocessing error: {e}, falling back to sequential processing")
-            if pool:
-                try:
-                    pool.terminate()
-                    pool.join()
-                except:
-                    pass
-            return self._convert_sequential(files_to_convert, progress_callback, cache)
+            print(f"Parallel conversion error: {e}, falling back to sequential processing")
+            cancelled = True  # Don't wait for the rest of the queue
+            fall_back = True
         
         finally:
-            # Always clean up the pool
-            if pool:
-                try:
-                    if cancelled:
-                        print("Terminating worker pool...")
-                        pool.terminate()
-                    else:
-                        pool.close()
-                    pool.join()
-                    print("Worker pool cleaned up")
-                except Exception as e:
-                    print(f"Error during pool cleanup: {e}")
-                    try:
-                        pool.terminate()
-                        pool.join()
-                    except:
-                        pass
+            # On cancellation drop this run's queued tasks instead of waiting
+            # for them, and kill the converters already running - their
+            # workers remove the partial output
+            if cancelled:
+                for future in futures:
+                    future.cancel()
+                _cancel_running_converters()
+        
+        if fall_back:
+            # The killed workers must be done cleaning up before the same
+            # files are converted again
+            wait(futures)
+            return self._convert_sequential(files_to_convert, progress_callback, cache)
         
         # Only try to send final progress if not cancelled
         if not cancelled and progress_callback:
@@ -341,68 +448,96 @@ class FileConverter:
         
         return success_count, error_count, errors
 
-    def convert_fcb_to_converted_xml(self, fcb_path):
-        """Optimized single file conversion with detailed diagnostics"""
+    def convert_fcb_to_converted_xml(self, fcb_path, verbose=None):
+        """Optimized single file conversion with detailed diagnostics
+        
+        The before/after directory listings are only taken when verbose
+        (default: self.debug) is set; otherwise the conversion costs a
+        couple of stat calls.
+        """
+        if verbose is None:
+            verbose = self.debug
+        
         try:
             converted_xml_path = fcb_path + ".converted.xml"
+            fcb_name = os.path.basename(fcb_path)
+            xml_name = fcb_name + ".converted.xml"
             
-            if os.path.exists(converted_xml_path):
-                print(f"Converted XML file already exists: {os.path.basename(converted_xml_path)}")
+            # Existing output (possibly edited) is never regenerated - one stat, no diagnostics
+            try:
+                os.stat(converted_xml_path)
+            except FileNotFoundError:
+                pass
+            else:
+                if verbose:
+                    print(f"Converted XML file already exists: {xml_name}")
                 return True
             
-            print(f"Converting FCB to converted XML: {os.path.basename(fcb_path)} -> {os.path.basename(converted_xml_path)}, Please Wait.")
-            
-            # Log the directory contents BEFORE conversion
-            fcb_dir = os.path.dirname(fcb_path)
-            print(f"Directory before conversion: {fcb_dir}")
-            before_files = set(os.listdir(fcb_dir))
-            print(f"Files before ({len(before_files)} total): {list(before_files)[:5]}...")  # Show first 5
+            print(f"Converting FCB to converted XML: {fcb_name} -> {xml_name}, Please Wait.")
             
             # Check if source file exists
-            if not os.path.exists(fcb_path):
+            try:
+                fcb_size_before = os.stat(fcb_path).st_size
+            except FileNotFoundError:
                 print(f"ERROR: Source FCB file does not exist: {fcb_path}")
                 return False
             
-            fcb_size_before = os.path.getsize(fcb_path)
-            print(f"Source FCB size before: {fcb_size_before} bytes")
+            fcb_dir = os.path.dirname(fcb_path)
+            
+            if verbose:
+                # Log the directory contents BEFORE conversion
+                print(f"Directory before conversion: {fcb_dir}")
+                before_files = _snapshot_dir(fcb_dir)
+                print(f"Files before ({len(before_files)} total): {list(before_files)[:5]}...")  # Show first 5
+                print(f"Source FCB size before: {fcb_size_before} bytes")
             
             # Run the FCB converter
-            print(f"Running converter: {self.fcb_converter_path} {fcb_path}")
+            if verbose:
+                print(f"Running converter: {self.fcb_converter_path} {fcb_path}")
             process = subprocess.run(
                 [self.fcb_converter_path, fcb_path],
-                stdout=subprocess.PIPE,
+                stdout=subprocess.PIPE if verbose else subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
                 text=True,
-                timeout=30
+                timeout=_converter_timeout(fcb_path),
+                **_subprocess_kwargs()
             )
             
-            print(f"Converter return code: {process.returncode}")
-            if process.stdout:
-                print(f"Converter stdout: {process.stdout}")
-            if process.stderr:
-                print(f"Converter stderr: {process.stderr}")
-            
-            # Log the directory contents AFTER conversion
-            after_files = set(os.listdir(fcb_dir))
-            new_files = after_files - before_files
-            deleted_files = before_files - after_files
-            
-            print(f"Files after ({len(after_files)} total)")
-            print(f"New files created: {new_files if new_files else 'NONE'}")
-            print(f"Files deleted: {deleted_files if deleted_files else 'NONE'}")
+            if verbose or process.returncode != 0:
+                print(f"Converter return code: {process.returncode}")
+                if process.stdout:
+                    print(f"Converter stdout: {process.stdout}")
+                if process.stderr:
+                    print(f"Converter stderr: {process.stderr}")
             
-            # Check if source FCB still exists
-            if not os.path.exists(fcb_path):
-                print(f"WARNING: Source FCB was DELETED by converter!")
-            else:
-                fcb_size_after = os.path.getsize(fcb_path)
-                if fcb_size_after != fcb_size_before:
-                    print(f"WARNING: Source FCB size changed: {fcb_size_before} -> {fcb_size_after}")
+            new_files = ()
+            if verbose:
+                # Log the directory contents AFTER conversion
+                after_files = _snapshot_dir(fcb_dir)
+                new_files = after_files.keys() - before_files.keys()
+                deleted_files = before_files.keys() - after_files.keys()
+                
+                print(f"Files after ({len(after_files)} total)")
+                print(f"New files created: {new_files if new_files else 'NONE'}")
+                print(f"Files deleted: {deleted_files if deleted_files else 'NONE'}")
+                
+                # Check if source FCB still exists
+                if fcb_name not in after_files:
+                    print(f"WARNING: Source FCB was DELETED by converter!")
+                else:
+                    fcb_size_after = after_files[fcb_name].stat(follow_symlinks=False).st_size
+                    if fcb_size_after != fcb_size_before:
+                        print(f"WARNING: Source FCB size changed: {fcb_size_before} -> {fcb_size_after}")
             
             # Check for expected output
-            if os.path.exists(converted_xml_path):
-                xml_size = os.path.getsize(converted_xml_path)
-                print(f"SUCCESS: Found expected output: {os.path.basename(converted_xml_path)} ({xml_size} bytes)")
+            try:
+                xml_size = os.stat(converted_xml_path).st_size
+            except FileNotFoundError:
+                xml_size = None
+            
+            if xml_size is not None:
+                if verbose:
+                    print(f"SUCCESS: Found expected output: {xml_name} ({xml_size} bytes)")
                 return True
             else:
                 print(f"ERROR: Expected output not found: {converted_xml_path}")
@@ -426,7 +561,7 @@ class FileConverter:
     def convert_fcb_to_xml(self, fcb_path):
         """Convert main FCB file to XML using Gibbed tools"""
         try:
-            binary_converter = os.path.join(self.tools_path, "Gibbed.Dunia.ConvertBinary.exe")
+            binary_converter = self.binary_converter_path
             xml_path = fcb_path.replace(".fcb", ".xml")
             
             # Check if Gibbed tools exist
@@ -444,10 +579,11 @@ class FileConverter:
             # Run the Gibbed converter
             process = subprocess.run(
                 [binary_converter, fcb_path, xml_path],
-                stdout=subprocess.PIPE,
+                stdout=subprocess.PIPE if self.debug else subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
                 text=True,
-                timeout=30
+                timeout=_converter_timeout(fcb_path),
+                **_subprocess_kwargs()
             )
             
             if process.returncode == 0 and os.path.exists(xml_path):
@@ -471,43 +607,47 @@ class FileConverter:
         """Convert .converted.xml back to FCB format"""
         try:
             converted_xml_path = original_fcb_path + ".converted.xml"
+            fcb_name = os.path.basename(original_fcb_path)
+            xml_name = fcb_name + ".converted.xml"
             
             if not os.path.exists(converted_xml_path):
-                print(f"No .converted.xml file found: {os.path.basename(converted_xml_path)}")
+                print(f"No .converted.xml file found: {xml_name}")
                 return False
             
             # Get expected output path
             fcb_dir = os.path.dirname(original_fcb_path)
-            base_name = os.path.splitext(os.path.basename(original_fcb_path))[0]
-            expected_new_fcb_path = os.path.join(fcb_dir, base_name + "_new.fcb")
+            base_name = os.path.splitext(fcb_name)[0]
+            new_fcb_name = base_name + "_new.fcb"
+            expected_new_fcb_path = os.path.join(fcb_dir, new_fcb_name)
             
-            print(f"Converting XML back to FCB: {os.path.basename(converted_xml_path)} -> {os.path.basename(expected_new_fcb_path)}, Please Wait.")
+            print(f"Converting XML back to FCB: {xml_name} -> {new_fcb_name}, Please Wait.")
             
             # Remove existing _new file if it exists
             if os.path.exists(expected_new_fcb_path):
                 try:
                     os.remove(expected_new_fcb_path)
-                    print(f"Removed existing: {os.path.basename(expected_new_fcb_path)}")
+                    print(f"Removed existing: {new_fcb_name}")
                 except Exception as e:
                     print(f"Warning: Could not remove existing file: {e}")
             
             # Run the FCB converter
             process = subprocess.run(
                 [self.fcb_converter_path, converted_xml_path],
-                stdout=subprocess.PIPE,
+                stdout=subprocess.PIPE if self.debug else subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
                 text=True,
-                timeout=30
+                timeout=_converter_timeout(converted_xml_path),
+                **_subprocess_kwargs()
             )
             
             if process.returncode == 0 and os.path.exists(expected_new_fcb_path):
                 fcb_size = os.path.getsize(expected_new_fcb_path)
-                print(f"Successfully converted: {os.path.basename(expected_new_fcb_path)} ({fcb_size} bytes)")
+                print(f"Successfully converted: {new_fcb_name} ({fcb_size} bytes)")
                 
                 # DEBUG: Check if we need to rename the file to replace the original
                 if expected_new_fcb_path != original_fcb_path:
-                    print(f"   ðŸ”„ New FCB created: {os.path.basename(expected_new_fcb_path)}")
-                    print(f"   ðŸŽ¯ Should replace: {os.path.basename(original_fcb_path)}")
+                    print(f"   ðŸ”„ New FCB created: {new_fcb_name}")
+                    print(f"   ðŸŽ¯ Should replace: {fcb_name}")
                     
                     # Check if original still exists
                     if os.path.exists(original_fcb_path):
@@ -555,41 +695,18 @@ class FileConverter:
         
         print(f"ðŸ—‘ Deleting {len(fcb_paths)} original FCB files, Please wait.")
         
-        for fcb_path in fcb_paths:
-            try:
-                if not os.path.exists(fcb_path):
-                    print(f"   âš  File already missing: {os.path.basename(fcb_path)}")
-                    continue
-                
-                # Get file info before deletion
-                file_size = os.path.getsize(fcb_path)
-                
-                # Make file writable if needed
-                try:
-                    current_attrs = os.stat(fcb_path).st_mode
-                    os.chmod(fcb_path, current_attrs | 0o200)  # Add write permission
-                except Exception as chmod_error:
-                    print(f"   âš  Could not change permissions for {os.path.basename(fcb_path)}: {chmod_error}")
-                
-                # Delete the file
-                os.remove(fcb_path)
-                
-                # Verify deletion
-                if not os.path.exists(fcb_path):
-                    deleted_files.append(fcb_path)
-                    print(f"   âœ“ Deleted: {os.path.basename(fcb_path)} ({file_size} bytes)")
-                else:
-                    failed_files.append(fcb_path)
-                    print(f"   âŒ Deletion failed: {os.path.basename(fcb_path)}")
-                    
-            except PermissionError as perm_error:
-                failed_files.append(fcb_path)
-                print(f"   âŒ Permission denied: {os.path.basename(fcb_path)} - {perm_error}")
-                print(f"   ðŸ’¡ Make sure the game is closed and no other programs are using the file")
-                
-            except Exception as e:
+        # Each file is an independent syscall or two - run them on a thread
+        # pool, then report in the original order
+        with ThreadPoolExecutor(max_workers=FILE_OP_MAX_WORKERS) as executor:
+            outcomes = list(executor.map(_delete_fcb_file, fcb_paths))
+        
+        for fcb_path, (status, messages) in zip(fcb_paths, outcomes):
+            for message in messages:
+                print(message)
+            if status is True:
+                deleted_files.append(fcb_path)
+            elif status is False:
                 failed_files.append(fcb_path)
-                print(f"   âŒ Error deleting {os.path.basename(fcb_path)}: {e}")
         
         print(f"ðŸ“Š Deletion summary: {len(deleted_files)} deleted, {len(failed_files)} failed")
         
@@ -599,49 +716,26 @@ class FileConverter:
         }
 
     def rename_new_fcb_files(self, new_fcb_paths, original_fcb_paths):
-        """Rename _new.fcb files to original names - SIMPLE RENAME (no overwriting)"""
+        """Rename _new.fcb files to original names - atomic replace of any leftover original"""
         renamed_files = []
         failed_renames = []
         
         print(f"ðŸ“ Renaming {len(new_fcb_paths)} _new.fcb files to original names, Please wait.")
         
-        for new_fcb_path, original_fcb_path in zip(new_fcb_paths, original_fcb_paths):
-            try:
-                if not os.path.exists(new_fcb_path):
-                    print(f"   âŒ New FCB file missing: {os.path.basename(new_fcb_path)}")
-                    failed_renames.append((new_fcb_path, original_fcb_path))
-                    continue
-                
-                # Check if target already exists (shouldn't happen if deletion worked)
-                if os.path.exists(original_fcb_path):
-                    print(f"   âš  Target file still exists: {os.path.basename(original_fcb_path)}")
-                    # Try to delete it one more time
-                    try:
-                        os.remove(original_fcb_path)
-                        print(f"   ðŸ—‘ Removed remaining target file")
-                    except Exception as e:
-                        print(f"   âŒ Could not remove target file: {e}")
-                        failed_renames.append((new_fcb_path, original_fcb_path))
-                        continue
-                
-                # Get file info before rename
-                new_file_size = os.path.getsize(new_fcb_path)
-                
-                # Perform the rename
-                print(f"   ðŸ“ Renaming: {os.path.basename(new_fcb_path)} â†’ {os.path.basename(original_fcb_path)}")
-                os.rename(new_fcb_path, original_fcb_path)
-                
-                # Verify the rename worked
-                if os.path.exists(original_fcb_path) and not os.path.exists(new_fcb_path):
-                    final_size = os.path.getsize(original_fcb_path)
-                    print(f"   âœ… Rename successful: {os.path.basename(original_fcb_path)} ({final_size} bytes)")
-                    renamed_files.append(original_fcb_path)
-                else:
-                    print(f"   âŒ Rename verification failed")
-                    failed_renames.append((new_fcb_path, original_fcb_path))
-                    
-            except Exception as e:
-                print(f"   âŒ Error renaming {os.path.basename(new_fcb_path)}: {e}")
+        # Each file is an independent syscall or two - run them on a thread
+        # pool, then report in the original order
+        pairs = list(zip(new_fcb_paths, original_fcb_paths))
+        with ThreadPoolExecutor(max_workers=FILE_OP_MAX_WORKERS) as executor:
+            outcomes = list(executor.map(
+                lambda new_path, original_path: _rename_new_fcb_file(new_path, original_path, self.debug),
+                new_fcb_paths, original_fcb_paths))
+        
+        for (new_fcb_path, original_fcb_path), (renamed, messages) in zip(pairs, outcomes):
+            for message in messages:
+                print(message)
+            if renamed:
+                renamed_files.append(original_fcb_path)
+            else:
                 failed_renames.append((new_fcb_path, original_fcb_path))
         
         print(f"ðŸ“Š Rename summary: {len(renamed_files)} successful, {len(failed_renames)} failed")
@@ -668,14 +762,21 @@ class FileConverter:
                 print(f"   âš  Could not remove backup {os.path.basename(backup_file)}: {e}")
 
     def convert_all_worldsector_files_improved(self, worldsectors_path):
-        """Improved method to convert all worldsector files with separated steps - NO BACKUPS"""
+        """Improved method to convert all worldsector files - NO BACKUPS
+        
+        Each file is deleted, converted back to FCB and renamed on its own
+        (see _rebuild_worldsector_file), so the files are pipelined across
+        the worker threads instead of every file waiting for each phase.
+        """
         try:
             print(f"\nðŸ”„ Starting improved WorldSector conversion process, Please wait.")
             
-            # Step 1: Find all .converted.xml files
-            import glob
-            xml_pattern = os.path.join(worldsectors_path, "*.data.fcb.converted.xml")
-            xml_files = glob.glob(xml_pattern)
+            # Step 1: Find all .converted.xml files - the same listing is
+            # reused for the original FCB sizes
+            with os.scandir(worldsectors_path) as entries:
+                dir_entries = {entry.path: entry for entry in entries}
+            xml_files = [path for path, entry in dir_entries.items()
+                         if entry.name.endswith('.data.fcb.converted.xml') and entry.is_file()]
             
             if not xml_files:
                 print(f"âŒ No .converted.xml files found in {worldsectors_path}")
@@ -683,56 +784,48 @@ class FileConverter:
             
             print(f"ðŸ“‹ Found {len(xml_files)} .converted.xml files to process")
             
-            # Step 2: Delete original FCB files FIRST (no backups)
-            print(f"\nðŸ—‘ Phase 1: Deleting original FCB files, Please wait.")
-            original_fcb_files = []
+            # One stat per original, read from the Step 1 listing
+            fcb_sizes = {}
             for xml_file in xml_files:
-                original_fcb = xml_file.replace('.converted.xml', '')
-                original_fcb_files.append(original_fcb)
-
+                entry = dir_entries.get(xml_file.replace('.converted.xml', ''))
+                if entry is not None and entry.is_file():
+                    fcb_sizes[xml_file] = entry.stat().st_size
+            
+            # Steps 2-4: delete original, convert XML to _new.fcb, rename -
+            # per file, all files in flight at once (no backups)
+            print(f"\nDeleting, converting and renaming {len(xml_files)} files, Please wait.")
+            
             deleted_files = []
             failed_deletions = []
+            new_fcb_files = []
+            renamed_files = []
+            failed_renames = []
             
-            for fcb_file in original_fcb_files:
-                try:
-                    if os.path.exists(fcb_file):
-                        file_size = os.path.getsize(fcb_file)
-                        os.remove(fcb_file)
-                        
-                        if not os.path.exists(fcb_file):
-                            deleted_files.append(fcb_file)
-                            print(f"   âœ“ Deleted: {os.path.basename(fcb_file)} ({file_size} bytes)")
-                        else:
-                            failed_deletions.append(fcb_file)
-                            print(f"   âŒ Failed to delete: {os.path.basename(fcb_file)}")
+            executor = self._get_executor()
+            futures = [executor.submit(self._rebuild_worldsector_file, xml_file, fcb_sizes.get(xml_file))
+                       for xml_file in xml_files]
+            
+            # Each file's remaining lines are printed once it is done
+            for future in as_completed(futures):
+                result = future.result()
+                print("\n".join(result['log']))
+                
+                if result['deleted'] is True:
+                    deleted_files.append(result['fcb_file'])
+                elif result['deleted'] is False:
+                    failed_deletions.append(result['fcb_file'])
+                if result['new_fcb_file']:
+                    new_fcb_files.append(result['new_fcb_file'])
+                    if result['renamed']:
+                        renamed_files.append(result['fcb_file'])
                     else:
-                        print(f"   âš  File doesn't exist: {os.path.basename(fcb_file)}")
-                        
-                except Exception as e:
-                    failed_deletions.append(fcb_file)
-                    print(f"   âŒ Error deleting {os.path.basename(fcb_file)}: {e}")
+                        failed_renames.append((result['new_fcb_file'], result['fcb_file']))
 
             if failed_deletions:
                 print(f"âš  Warning: {len(failed_deletions)} files could not be deleted:")
                 for failed_file in failed_deletions:
                     print(f"   - {os.path.basename(failed_file)}")
                 print(f"ðŸ’¡ Make sure the game is closed and try again")
-
-            # Step 3: Convert XML files to _new.fcb files (now that originals are gone)
-            print(f"\nðŸ“ Phase 2: Converting XML files to FCB, Please wait.")
-            new_fcb_files = []
-
-            for xml_file in xml_files:
-                original_fcb = xml_file.replace('.converted.xml', '')
-                
-                print(f"\nðŸ”§ Converting: {os.path.basename(xml_file)}")
-                new_fcb_path = self.convert_converted_xml_back_to_fcb(original_fcb)
-                
-                if new_fcb_path:
-                    new_fcb_files.append(new_fcb_path)
-                    print(f"   âœ… Success: {os.path.basename(new_fcb_path)}")
-                else:
-                    print(f"   âŒ Failed: {os.path.basename(xml_file)}")
             
             if not new_fcb_files:
                 print(f"âŒ No FCB files were successfully converted")
@@ -740,45 +833,21 @@ class FileConverter:
             
             print(f"\nðŸ“Š Conversion Results: {len(new_fcb_files)}/{len(xml_files)} successful")
             
-            # Step 4: Rename _new.fcb files to original names
-            print(f"\nðŸ“ Phase 3: Renaming _new.fcb files, Please wait.")
-            
-            renamed_files = []
-            failed_renames = []
-            
-            for new_file, original_file in zip(new_fcb_files, original_fcb_files):
-                try:
-                    if os.path.exists(new_file):
-                        new_file_size = os.path.getsize(new_file)
-                        os.rename(new_file, original_file)
-                        
-                        if os.path.exists(original_file) and not os.path.exists(new_file):
-                            renamed_files.append(original_file)
-                            final_size = os.path.getsize(original_file)
-                            print(f"   âœ… Renamed: {os.path.basename(new_file)} â†’ {os.path.basename(original_file)} ({final_size} bytes)")
-                        else:
-                            failed_renames.append((new_file, original_file))
-                            print(f"   âŒ Rename failed: {os.path.basename(new_file)}")
-                    else:
-                        failed_renames.append((new_file, original_file))
-                        print(f"   âŒ New file missing: {os.path.basename(new_file)}")
-                        
-                except Exception as e:
-                    failed_renames.append((new_file, original_file))
-                    print(f"   âŒ Error renaming {os.path.basename(new_file)}: {e}")
-            
             # Step 5: Clean up XML files
             print(f"\nðŸ§¹ Phase 4: Cleanup, Please wait.")
             
             if len(renamed_files) == len(xml_files) and not failed_renames:
                 # Complete success - clean up XML files
                 print(f"ðŸ—‘ Removing .converted.xml files, Please wait.")
-                for xml_file in xml_files:
-                    try:
-                        os.remove(xml_file)
-                        print(f"   âœ“ Removed: {os.path.basename(xml_file)}")
-                    except Exception as e:
-                        print(f"   âš  Could not remove {os.path.basename(xml_file)}: {e}")
+                phase_log = []  # Printed in one go once the phase is done
+                with ThreadPoolExecutor(max_workers=FILE_OP_MAX_WORKERS) as executor:
+                    for xml_file, e in executor.map(_remove_file, xml_files):
+                        if e is None:
+                            phase_log.append(f"   âœ“ Removed: {os.path.basename(xml_file)}")
+                        else:
+                            phase_log.append(f"   âš  Could not remove {os.path.basename(xml_file)}: {e}")
+                if phase_log:
+                    print("\n".join(phase_log))
             else:
                 # Partial success - keep XML files for troubleshooting
                 print(f"âš  Partial success - keeping XML files for troubleshooting")
@@ -804,30 +873,84 @@ class FileConverter:
             traceback.print_exc()
             return False
         
-    def restore_from_backups(self, backup_files):
-        """Restore original files from backups if something goes wrong"""
-        print(f"ðŸ”„ Restoring {len(backup_files)} files from backups, Please wait.")
+    def _rebuild_worldsector_file(self, xml_file, fcb_size):
+        """Delete, convert and rename one worldsector file for convert_all_worldsector_files_improved
         
-        restored_count = 0
-        for backup_file in backup_files:
+        fcb_size is the original .data.fcb's size, None if it doesn't exist.
+        Returns a dict with the outcome of each step and the file's log lines.
+        """
+        original_fcb = xml_file.replace('.converted.xml', '')
+        fcb_name = os.path.basename(original_fcb)
+        xml_name = os.path.basename(xml_file)
+        result = {
+            'fcb_file': original_fcb,
+            'deleted': None,  # True/False, None if there was no original
+            'new_fcb_file': None,
+            'renamed': False,
+            'log': []
+        }
+        log = result['log']
+        
+        # Delete the original FCB file first
+        if fcb_size is None:
+            log.append(f"   âš  File doesn't exist: {fcb_name}")
+        else:
             try:
-                if not os.path.exists(backup_file):
-                    print(f"   âš  Backup missing: {os.path.basename(backup_file)}")
-                    continue
-                
-                # Get original file path
-                if backup_file.endswith('.pre_delete_backup'):
-                    original_file = backup_file.replace('.pre_delete_backup', '')
-                else:
-                    original_file = backup_file.replace('.backup', '')
-                
-                # Restore the file
-                shutil.copy2(backup_file, original_file)
-                print(f"   âœ… Restored: {os.path.basename(original_file)}")
-                restored_count += 1
-                
+                os.remove(original_fcb)
+                result['deleted'] = True
+                log.append(f"   âœ“ Deleted: {fcb_name} ({fcb_size} bytes)")
             except Exception as e:
-                print(f"   âŒ Error restoring {os.path.basename(backup_file)}: {e}")
+                result['deleted'] = False
+                log.append(f"   âŒ Error deleting {fcb_name}: {e}")
+        
+        # Convert the XML file to a _new.fcb file (now that the original is gone)
+        log.append(f"\nðŸ”§ Converting: {xml_name}")
+        
+        # The conversion prints its own lines, so get ours out ahead of them
+        print("\n".join(log))
+        log.clear()
+        
+        new_fcb_path = self.convert_converted_xml_back_to_fcb(original_fcb)
+        if not new_fcb_path:
+            log.append(f"   âŒ Failed: {xml_name}")
+            return result
+        
+        result['new_fcb_file'] = new_fcb_path
+        new_name = os.path.basename(new_fcb_path)
+        log.append(f"   âœ… Success: {new_name}")
+        
+        # Rename the _new.fcb file to the original name
+        try:
+            # Size taken up front - a successful rename is atomic, so
+            # there is nothing to verify afterwards
+            final_size = os.path.getsize(new_fcb_path)
+            os.rename(new_fcb_path, original_fcb)
+            result['renamed'] = True
+            log.append(f"   âœ… Renamed: {new_name} â†’ {fcb_name} ({final_size} bytes)")
+        except FileNotFoundError:
+            log.append(f"   âŒ New file missing: {new_name}")
+        except Exception as e:
+            log.append(f"   âŒ Error renaming {new_name}: {e}")
+        
+        return result
+        
+    def restore_from_backups(self, backup_files, keep_backups=True):
+        """Restore original files from backups if something goes wrong
+        
+        Backups are copied back in parallel. With keep_backups=False they are
+        moved instead, which is a plain rename when they sit on the same
+        drive as the originals.
+        """
+        print(f"ðŸ”„ Restoring {len(backup_files)} files from backups, Please wait.")
+        
+        restored_count = 0
+        with ThreadPoolExecutor(max_workers=FILE_OP_MAX_WORKERS) as executor:
+            outcomes = executor.map(partial(_restore_backup_file, keep_backup=keep_backups), backup_files)
+            for restored, messages in outcomes:
+                for message in messages:
+                    print(message)
+                if restored:
+                    restored_count += 1
         
         print(f"ðŸ“Š Restored {restored_count}/{len(backup_files)} files")
         return restored_count
@@ -835,20 +958,26 @@ class FileConverter:
     def get_data_file_info(self, worldsectors_path):
         """Get information about .data files in worldsectors folder"""
         try:
-            # Find all .data.fcb files
-            fcb_pattern = os.path.join(worldsectors_path, "*.data.fcb")
-            fcb_files = glob.glob(fcb_pattern)
-
-            # Find converted .xml files for data.fcb
-            converted_pattern = os.path.join(worldsectors_path, "*.data.fcb.converted.xml")
-            converted_files = glob.glob(converted_pattern)
+            # One directory read serves both file types; only entries with a
+            # matching name get the is_file() check (which may need a stat)
+            fcb_files = []
+            converted_files = []
+            with os.scandir(worldsectors_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.endswith('.data.fcb'):
+                        # Find all .data.fcb files
+                        if entry.is_file():
+                            fcb_files.append(entry.path)
+                    elif name.endswith('.data.fcb.converted.xml'):
+                        # Find converted .xml files for data.fcb
+                        if entry.is_file():
+                            converted_files.append(entry.path)
 
             # Count files that still need conversion
-            needs_conversion = 0
-            for fcb_file in fcb_files:
-                expected_xml = fcb_file + ".converted.xml"
-                if not os.path.exists(expected_xml):
-                    needs_conversion += 1
+            converted_set = set(converted_files)
+            needs_conversion = sum(1 for fcb_file in fcb_files
+                                   if fcb_file + ".converted.xml" not in converted_set)
 
             return {
                 'total_fcb_files': len(fcb_files),
@@ -876,33 +1005,23 @@ class FileConverter:
                 progress_callback(1.0)
             return 0, 0, []
 
-        # Define main files to convert
-        target_fcb_files = [
-            '.managers.fcb',
-            'mapsdata.fcb',
-            '.omnis.fcb',
-            'sectorsdep.fcb'
-        ]
-
         print("Looking for main FCB files to convert, Please wait.")
 
-        # Find target files
+        # Find target files (see _MAIN_FCB_TARGETS) - the XML check uses the
+        # same directory listing instead of a stat per file
         files_to_convert = []
-        for root, _, files in os.walk(folder_path):
-            for filename in files:
+        for _, entries in _scan_tree(folder_path):
+            for filename, entry in entries.items():
                 # Skip game files
                 if filename.endswith(".game.xml"):
                     continue
 
-                file_path = os.path.join(root, filename)
-
                 # Check if matches target pattern
-                for target_pattern in target_fcb_files:
-                    if filename.endswith(target_pattern) or target_pattern in filename:
-                        xml_path = file_path.replace(".fcb", ".xml")
-                        if not os.path.exists(xml_path):
-                            files_to_convert.append(file_path)
-                        break
+                if not _MAIN_FCB_RE.search(filename) or entry.is_dir():
+                    continue
+
+                if filename.replace(".fcb", ".xml") not in entries:
+                    files_to_convert.append(entry.path)
 
         if not files_to_convert:
             print("No FCB files found that need conversion")
@@ -910,15 +1029,22 @@ class FileConverter:
                 progress_callback(1.0)
             return 0, 0, []
 
-        # Convert files using Gibbed tools
+        # Convert files using Gibbed tools - one converter process per file,
+        # run side by side on the shared worker threads
         success_count = 0
         error_count = 0
         errors = []
 
-        for i, file_path in enumerate(files_to_convert):
+        executor = self._get_executor()
+        futures = {executor.submit(self.convert_main_fcb_to_xml, file_path): file_path
+                   for file_path in files_to_convert}
+
+        # Unordered, so a slow file doesn't hold up the progress bar
+        for i, future in enumerate(as_completed(futures)):
+            file_path = futures[future]
             try:
                 # Use Gibbed tool for all FCBs
-                if self.convert_main_fcb_to_xml(file_path):
+                if future.result():
                     success_count += 1
                 else:
                     error_count += 1
@@ -938,13 +1064,12 @@ class FileConverter:
 
     def has_gibbed_tools(self):
         """Check if Gibbed tools are available for main file conversion"""
-        binary_converter = os.path.join(self.tools_path, "Gibbed.Dunia.ConvertBinary.exe")
-        return os.path.exists(binary_converter)
+        return os.path.exists(self.binary_converter_path)
 
     def convert_main_fcb_to_xml(self, fcb_path):
         """Convert main FCB file to XML using Gibbed tools"""
         try:
-            binary_converter = os.path.join(self.tools_path, "Gibbed.Dunia.ConvertBinary.exe")
+            binary_converter = self.binary_converter_path
             xml_path = fcb_path.replace(".fcb", ".xml")
             
             if os.path.exists(xml_path):
@@ -952,10 +1077,10 @@ class FileConverter:
             
             process = subprocess.run(
                 [binary_converter, fcb_path, xml_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=30
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=_converter_timeout(fcb_path),
+                **_subprocess_kwargs()
             )
             
             return process.returncode == 0 and os.path.exists(xml_path)
@@ -967,7 +1092,7 @@ class FileConverter:
     def convert_xml_to_fcb(self, xml_path):
         """Convert main XML file back to FCB using Gibbed tools"""
         try:
-            binary_converter = os.path.join(self.tools_path, "Gibbed.Dunia.ConvertBinary.exe")
+            binary_converter = self.binary_converter_path
             fcb_path = xml_path.replace(".xml", ".fcb")
             
             # Remove existing FCB
@@ -976,10 +1101,10 @@ class FileConverter:
             
             process = subprocess.run(
                 [binary_converter, "--fcb", xml_path, fcb_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=30
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=_converter_timeout(xml_path),
+                **_subprocess_kwargs()
             )
             
             return process.returncode == 0 and os.path.exists(fcb_path)
@@ -988,11 +1113,252 @@ class FileConverter:
             print(f"Error converting XML to FCB {xml_path}: {e}")
             return False
         
-def _convert_fcb_worker(task):
-    """Worker function for parallel FCB conversion - runs in separate process"""
-    fcb_path, converter_path = task
+def _remove_file(path):
+    """os.remove() for thread pool maps - returns (path, None or the exception)"""
+    try:
+        os.remove(path)
+        return path, None
+    except Exception as e:
+        return path, e
+
+
+def _restore_backup_file(backup_file, keep_backup=True):
+    """Restore one backup for FileConverter.restore_from_backups
+    
+    Returns (restored, log lines).
+    """
+    messages = []
+    
+    # Get original file path
+    if backup_file.endswith('.pre_delete_backup'):
+        original_file = backup_file.replace('.pre_delete_backup', '')
+    else:
+        original_file = backup_file.replace('.backup', '')
+    
+    try:
+        # Restore the file - moving is a rename unless the backup lives on
+        # another drive, in which case os.replace fails and it is copied
+        restored = False
+        if not keep_backup:
+            try:
+                os.replace(backup_file, original_file)
+                restored = True
+            except FileNotFoundError:
+                raise
+            except OSError:
+                pass
+        
+        if not restored:
+            shutil.copy2(backup_file, original_file)
+            if not keep_backup:
+                # Copied across drives - the backup still has to go
+                _, error = _remove_file(backup_file)
+                if error is not None:
+                    messages.append(f"   âš  Could not remove backup {os.path.basename(backup_file)}: {error}")
+        
+        messages.append(f"   âœ… Restored: {os.path.basename(original_file)}")
+        return True, messages
+        
+    except FileNotFoundError:
+        messages.append(f"   âš  Backup missing: {os.path.basename(backup_file)}")
+    except Exception as e:
+        messages.append(f"   âŒ Error restoring {os.path.basename(backup_file)}: {e}")
+    
+    return False, messages
+
+
+def _delete_fcb_file(fcb_path):
+    """Delete one original FCB file for FileConverter.delete_original_fcb_files
+    
+    Returns (True deleted / False failed / None already missing, log lines).
+    """
+    messages = []
+    status = False
+    try:
+        # Get file info before deletion - also tells us if it is already gone
+        try:
+            file_stat = os.stat(fcb_path)
+        except FileNotFoundError:
+            messages.append(f"   âš  File already missing: {os.path.basename(fcb_path)}")
+            return None, messages
+        
+        # Delete the file - only read-only files need their permissions changed first
+        try:
+            os.remove(fcb_path)
+        except PermissionError:
+            try:
+                os.chmod(fcb_path, file_stat.st_mode | 0o200)  # Add write permission
+            except Exception as chmod_error:
+                messages.append(f"   âš  Could not change permissions for {os.path.basename(fcb_path)}: {chmod_error}")
+            os.remove(fcb_path)
+        
+        status = True
+        messages.append(f"   âœ“ Deleted: {os.path.basename(fcb_path)} ({file_stat.st_size} bytes)")
+            
+    except PermissionError as perm_error:
+        status = False
+        messages.append(f"   âŒ Permission denied: {os.path.basename(fcb_path)} - {perm_error}")
+        messages.append(f"   ðŸ’¡ Make sure the game is closed and no other programs are using the file")
+        
+    except Exception as e:
+        status = False
+        messages.append(f"   âŒ Error deleting {os.path.basename(fcb_path)}: {e}")
+    
+    return status, messages
+
+
+def _rename_new_fcb_file(new_fcb_path, original_fcb_path, verbose=False):
+    """Rename one _new.fcb file for FileConverter.rename_new_fcb_files
+    
+    os.replace() overwrites any leftover target atomically, so no separate
+    exists/remove steps are needed. Returns (renamed, log lines).
+    """
+    messages = []
+    new_name = os.path.basename(new_fcb_path)
+    original_name = os.path.basename(original_fcb_path)
+    try:
+        # Check if target already exists (shouldn't happen if deletion worked) -
+        # purely informational, os.replace() handles it
+        if verbose and os.path.exists(original_fcb_path):
+            messages.append(f"   âš  Target file still exists: {original_name}")
+        
+        # Perform the rename
+        messages.append(f"   ðŸ“ Renaming: {new_name} â†’ {original_name}")
+        os.replace(new_fcb_path, original_fcb_path)
+        
+        final_size = os.path.getsize(original_fcb_path)
+        messages.append(f"   âœ… Rename successful: {original_name} ({final_size} bytes)")
+        return True, messages
+        
+    except FileNotFoundError:
+        messages.append(f"   âŒ New FCB file missing: {new_name}")
+    except Exception as e:
+        messages.append(f"   âŒ Error renaming {new_name}: {e}")
+    
+    return False, messages
+
+
+@lru_cache(maxsize=None)
+def _subprocess_kwargs():
+    """subprocess.run() arguments for launching the converter tools
     
+    Keeps the console window hidden and doesn't let the child inherit the
+    editor's handles (enumerating those makes process creation slower).
+    Built once - subprocess copies the STARTUPINFO, so it can be shared.
+    """
+    if sys.platform != 'win32':
+        return {'close_fds': True}
+    
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    startupinfo.wShowWindow = subprocess.SW_HIDE
+    return {'startupinfo': startupinfo, 'creationflags': subprocess.CREATE_NO_WINDOW, 'close_fds': True}
+
+
+def _run_converter(args, timeout, **kwargs):
+    """subprocess.run() for the conversion workers
+    
+    The process is registered while it runs so _cancel_running_converters()
+    can kill it; raises _ConversionCancelled if that happened.
+    """
+    with subprocess.Popen(args, **kwargs, **_subprocess_kwargs()) as process:
+        with _running_converters_lock:
+            cancelled = _converters_cancelled.is_set()
+            if not cancelled:
+                _running_converters.add(process)
+        if cancelled:
+            process.kill()
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
+        finally:
+            with _running_converters_lock:
+                _running_converters.discard(process)
+                cancelled = _converters_cancelled.is_set()
+    
+    if cancelled and process.returncode != 0:
+        raise _ConversionCancelled()
+    return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+
+
+def _cancel_running_converters():
+    """Kill every converter started through _run_converter(), and any started
+    before the next conversion run begins"""
+    with _running_converters_lock:
+        _converters_cancelled.set()
+        processes = list(_running_converters)
+    
+    for process in processes:
+        try:
+            process.kill()
+        except OSError:
+            pass
+
+
+def _convert_fcb_single_worker(fcb_path, converter_path):
+    """Worker for one file per task - returns a one-item result list like the batch worker"""
+    return [_convert_fcb_worker(fcb_path, converter_path)]
+
+
+def _convert_fcb_batch_worker(fcb_paths, converter_path):
+    """Worker function converting a batch of FCB files with one converter process
+    
+    Files the batch run did not produce output for are retried one at a time.
+    """
+    # Never hand the converter a file whose XML already exists - it may have been edited
+    pending = [fcb_path for fcb_path in fcb_paths
+               if not os.path.exists(fcb_path + ".converted.xml")]
+    
+    batch_ok = True
+    try:
+        if pending:
+            process = _run_converter(
+                [converter_path, *pending],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=sum(map(_converter_timeout, pending))
+            )
+            batch_ok = process.returncode == 0
+    except _ConversionCancelled:
+        # Outputs of a killed batch may be partial - none of them count
+        for fcb_path in pending:
+            _remove_file(fcb_path + ".converted.xml")
+        return [_cancelled_result(fcb_path) for fcb_path in fcb_paths]
+    except Exception:
+        batch_ok = False  # Timed out, crashed or couldn't start
+    
+    if not batch_ok:
+        # Outputs of a failed batch may be truncated - retried one by one below,
+        # where the per-file errors are reported
+        for fcb_path in pending:
+            _remove_file(fcb_path + ".converted.xml")
+    
+    pending = set(pending)
+    results = []
+    for fcb_path in fcb_paths:
+        converted_xml_path = fcb_path + ".converted.xml"
+        if fcb_path in pending and os.path.exists(converted_xml_path):
+            filename = os.path.basename(fcb_path)
+            xml_size = os.path.getsize(converted_xml_path)
+            results.append({
+                'fcb_file': fcb_path,
+                'filename': filename,
+                'success': True,
+                'error': None,
+                'message': f"Converted: {filename} ({xml_size} bytes)"
+            })
+        else:
+            results.append(_convert_fcb_worker(fcb_path, converter_path))
+    return results
+
+
+def _convert_fcb_worker(fcb_path, converter_path):
+    """Worker function for parallel FCB conversion - runs in a worker thread"""
     result = {
+        'fcb_file': fcb_path,
         'filename': os.path.basename(fcb_path),
         'success': False,
         'error': None,
@@ -1002,47 +1368,42 @@ def _convert_fcb_worker(task):
     try:
         converted_xml_path = fcb_path + ".converted.xml"
         
-        # Check if already exists
+        # Check if already exists - still reported as a success so the caller
+        # records it in the cache and later scans skip it up front
         if os.path.exists(converted_xml_path):
             result['success'] = True
+            result['from_existing_output'] = True
             result['message'] = f"Already converted: {result['filename']}"
             return result
         
-        # Get directory for checking new files
-        fcb_dir = os.path.dirname(fcb_path)
-        before_files = set(os.listdir(fcb_dir))
-        
-        # Create startup info to hide console window
-        startupinfo = None
-        if sys.platform == 'win32':
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-        
         # Run the FCB converter with hidden window
-        process = subprocess.run(
+        process = _run_converter(
             [converter_path, fcb_path],
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,  # Only stderr is reported
             stderr=subprocess.PIPE,
             text=True,
-            timeout=30,
-            startupinfo=startupinfo,
-            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+            timeout=_converter_timeout(fcb_path)
         )
         
         if process.returncode == 0:
             # Check what happened
-            after_files = set(os.listdir(fcb_dir))
-            new_files = after_files - before_files
-            deleted_files = before_files - after_files
+            try:
+                xml_size = os.stat(converted_xml_path).st_size
+            except FileNotFoundError:
+                xml_size = None
             
-            if os.path.exists(converted_xml_path):
-                xml_size = os.path.getsize(converted_xml_path)
+            if xml_size is not None:
                 result['success'] = True
                 result['message'] = f"Converted: {result['filename']} ({xml_size} bytes)"
             else:
-                # File was converted but output missing
-                result['error'] = f"Output missing. New: {new_files}, Deleted: {deleted_files}"
+                # File was converted but output missing - one stat of the input
+                # says whether the converter consumed it, without listing the
+                # folder every other worker is writing to
+                try:
+                    source_state = f"source FCB still present ({os.stat(fcb_path).st_size} bytes)"
+                except FileNotFoundError:
+                    source_state = "source FCB is gone"
+                result['error'] = f"Output missing, {source_state}"
                 result['message'] = f"Failed: {result['filename']}"
         else:
             result['error'] = f"Return code: {process.returncode}"
@@ -1050,11 +1411,27 @@ def _convert_fcb_worker(task):
                 result['error'] += f" - {process.stderr[:100]}"
             result['message'] = f"Failed: {result['filename']}"
     
+    except _ConversionCancelled:
+        _remove_file(fcb_path + ".converted.xml")  # Possibly partial
+        return _cancelled_result(fcb_path)
     except subprocess.TimeoutExpired:
+        _remove_file(fcb_path + ".converted.xml")  # Possibly partial
         result['error'] = "Conversion timed out"
         result['message'] = f"Timeout: {result['filename']}"
     except Exception as e:
         result['error'] = str(e)
         result['message'] = f"Error: {result['filename']}"
     
-    return result
\ No newline at end of file
+    return result
+
+
+def _cancelled_result(fcb_path):
+    """Worker result for a file whose conversion was cancelled"""
+    filename = os.path.basename(fcb_path)
+    return {
+        'fcb_file': fcb_path,
+        'filename': filename,
+        'success': False,
+        'error': "Cancelled",
+        'message': f"Cancelled: {filename}"
+    }
\ No newline at end of file
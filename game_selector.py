@@ -1,13 +1,38 @@
 """Game selection dialog for choosing between Avatar and Far Cry 2"""
 
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
                               QLabel, QWidget, QFrame)
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QPixmap
+from PyQt6.QtGui import QFont, QPixmap, QPainter
+
+@lru_cache(maxsize=32)
+def darken_color(hex_color, factor=0.2):
+    """Darken a hex color by a factor - cached, the palette is fixed"""
+    # Remove '#' if present
+    hex_color = hex_color.lstrip('#')
+    
+    # Convert to RGB
+    r = int(hex_color[0:2], 16)
+    g = int(hex_color[2:4], 16)
+    b = int(hex_color[4:6], 16)
+    
+    # Darken
+    r = int(r * (1 - factor))
+    g = int(g * (1 - factor))
+    b = int(b * (1 - factor))
+    
+    # Convert back to hex
+    return f"#{r:02x}{g:02x}{b:02x}"
 
 class GameSelectorDialog(QDialog):
     """Dialog for selecting which game to edit"""
     
+    # Finished icon canvases by (icon_path, size) - shared by every instance so
+    # reopening the dialog doesn't decode and rescale the PNGs again
+    _icon_cache = {}
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.selected_game = None
@@ -92,39 +117,9 @@ class GameSelectorDialog(QDialog):
         
         # Icon (optional)
         if icon_path:
-            icon_label = QLabel()
-            pixmap = QPixmap(icon_path)
-            if pixmap.isNull():
-                print(f"Warning: Could not load icon: {icon_path}")
-            else:
-                # Target display size for zoomed icon
-                target_size = 240
-
-                # If icon is smaller than target, scale it up with FastTransformation
-                if pixmap.width() < target_size and pixmap.height() < target_size:
-                    pixmap = pixmap.scaled(
-                        target_size, target_size,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.FastTransformation  # nearest-neighbor, keeps it sharp
-                    )
-                else:
-                    # Large icons scale down smoothly
-                    pixmap = pixmap.scaled(
-                        target_size, target_size,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-
-                # Center the icon on a 120x120 canvas
-                canvas = QPixmap(target_size, target_size)
-                canvas.fill(Qt.GlobalColor.transparent)
-                from PyQt6.QtGui import QPainter
-                painter = QPainter(canvas)
-                x = (target_size - pixmap.width()) // 2
-                y = (target_size - pixmap.height()) // 2
-                painter.drawPixmap(x, y, pixmap)
-                painter.end()
-
+            canvas = self.get_icon_canvas(icon_path)
+            if canvas is not None:
+                icon_label = QLabel()
                 icon_label.setPixmap(canvas)
                 icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 button_layout.addWidget(icon_label)
@@ -157,23 +152,49 @@ class GameSelectorDialog(QDialog):
         
         return button
     
+    @classmethod
+    def get_icon_canvas(cls, icon_path, target_size=240):
+        """Icon scaled and centered on a transparent target_size canvas, or None if it can't be loaded"""
+        key = (icon_path, target_size)
+        canvas = cls._icon_cache.get(key)
+        if canvas is not None:
+            return canvas
+        
+        pixmap = QPixmap()
+        if not pixmap.load(icon_path, None, Qt.ImageConversionFlag.NoFormatConversion):
+            print(f"Warning: Could not load icon: {icon_path}")
+            return None
+        
+        # If icon is smaller than target, scale it up with FastTransformation
+        if pixmap.width() < target_size and pixmap.height() < target_size:
+            pixmap = pixmap.scaled(
+                target_size, target_size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.FastTransformation  # nearest-neighbor, keeps it sharp
+            )
+        else:
+            # Large icons scale down smoothly
+            pixmap = pixmap.scaled(
+                target_size, target_size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+
+        # Center the icon on the canvas
+        canvas = QPixmap(target_size, target_size)
+        canvas.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(canvas)
+        x = (target_size - pixmap.width()) // 2
+        y = (target_size - pixmap.height()) // 2
+        painter.drawPixmap(x, y, pixmap)
+        painter.end()
+        
+        cls._icon_cache[key] = canvas
+        return canvas
+    
     def darken_color(self, hex_color, factor=0.2):
         """Darken a hex color by a factor"""
-        # Remove '#' if present
-        hex_color = hex_color.lstrip('#')
-        
-        # Convert to RGB
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        
-        # Darken
-        r = int(r * (1 - factor))
-        g = int(g * (1 - factor))
-        b = int(b * (1 - factor))
-        
-        # Convert back to hex
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return darken_color(hex_color, factor)
     
     def select_game(self, game):
         """Handle game selection"""
@@ -1,19 +1,22 @@
 # hash_parser.py
 import xml.etree.ElementTree as ET
 import os
+import sys
 
 class HashParser:
     """Parser for binary class definitions to convert hash values to readable names"""
     
-    def __init__(self, binary_classes_path=None):
+    def __init__(self, binary_classes_path=None, debug=False):
         """
         Initialize the hash parser with binary class definitions
         
         Args:
             binary_classes_path (str, optional): Path to the binary_classes.xml file
+            debug (bool, optional): Print every class/member mapping as it is loaded
         """
         self.class_hash_map = {}  # Maps class hashes to class names
         self.member_hash_map = {}  # Maps member hashes to member names
+        self.debug = debug  # Per-mapping console output
         
         # Default path for binary_classes.xml (in the FCCU_FC2 project folder)
         if not binary_classes_path:
@@ -35,52 +38,75 @@ class HashParser:
                 return
             
             print(f"Loading binary class definitions from {file_path}")
-            
-            # Try to read the content of the file directly for debugging
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                print(f"File size: {len(content)} bytes")
-                print(f"First 500 characters:\n{content[:500]}...")
-            
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            print(f"XML root tag: {root.tag}")
-            print(f"Number of direct child elements: {len(list(root))}")
-            
-            # Count classes and members
-            class_count = len(root.findall(".//class"))
-            member_count = len(root.findall(".//member"))
-            print(f"Total classes found: {class_count}")
-            print(f"Total members found: {member_count}")
-            
-            # Count classes with hash attributes
-            classes_with_hash = len(root.findall(".//class[@hash]"))
-            members_with_hash = len(root.findall(".//member[@hash]"))
-            print(f"Classes with hash attribute: {classes_with_hash}")
-            print(f"Members with hash attribute: {members_with_hash}")
-            
-            # Process all class definitions
-            for class_elem in root.findall(".//class"):
+            print(f"File size: {os.path.getsize(file_path)} bytes")
+            
+            # Single streaming pass - the counts and mappings are collected as
+            # elements close, and each class is cleared once it is processed
+            root = None
+            depth = 0
+            child_count = 0
+            class_count = 0
+            member_count = 0
+            classes_with_hash = 0
+            members_with_hash = 0
+            
+            for event, elem in ET.iterparse(file_path, events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = elem
+                        print(f"XML root tag: {root.tag}")
+                    elif depth == 1:
+                        child_count += 1
+                    depth += 1
+                    continue
+                
+                depth -= 1
+                
+                if elem.tag == "member":
+                    # Count members
+                    member_count += 1
+                    if "hash" in elem.attrib:
+                        members_with_hash += 1
+                    continue
+                
+                if elem.tag != "class":
+                    continue
+                
+                # Count classes
+                class_count += 1
+                if "hash" in elem.attrib:
+                    classes_with_hash += 1
+                
                 # Get class hash and name
-                class_hash = class_elem.get("hash")
-                class_name = class_elem.get("name")
+                class_hash = elem.get("hash")
+                class_name = elem.get("name")
                 
                 if class_hash:
                     # Store class hash mapping if hash is available
                     name_to_use = class_name if class_name else f"Class_{class_hash}"
-                    self.class_hash_map[class_hash] = name_to_use
-                    print(f"Added class mapping: {class_hash} -> {name_to_use}")
+                    # Interned - the maps are hit for every hash in every file parsed
+                    self.class_hash_map[sys.intern(class_hash)] = sys.intern(name_to_use)
+                    if self.debug:
+                        print(f"Added class mapping: {class_hash} -> {name_to_use}")
                 
                 # Process all member definitions within this class
-                for member_elem in class_elem.findall("./member"):
+                for member_elem in elem.findall("./member"):
                     member_hash = member_elem.get("hash")
                     member_name = member_elem.get("name")
                     
                     if member_hash and member_name:
                         # Store member hash mapping if hash and name are available
-                        self.member_hash_map[member_hash] = member_name
-                        print(f"Added member mapping: {member_hash} -> {member_name}")
+                        self.member_hash_map[sys.intern(member_hash)] = sys.intern(member_name)
+                        if self.debug:
+                            print(f"Added member mapping: {member_hash} -> {member_name}")
+                
+                elem.clear()
+            
+            print(f"Number of direct child elements: {child_count}")
+            print(f"Total classes found: {class_count}")
+            print(f"Total members found: {member_count}")
+            print(f"Classes with hash attribute: {classes_with_hash}")
+            print(f"Members with hash attribute: {members_with_hash}")
             
             print(f"Loaded {len(self.class_hash_map)} class hash mappings and {len(self.member_hash_map)} member hash mappings")
             
@@ -117,36 +143,39 @@ class HashParser:
         """
         Parse an XML element and update hash values with names if available
         
+        The element and all its descendants are processed in a single
+        iterative pass, so deeply nested files can't hit the recursion limit.
+        
         Args:
             elem (Element): XML element to parse
             
         Returns:
             Element: Updated XML element
         """
-        # Check if this element has a hash attribute
-        if "hash" in elem.attrib:
-            hash_value = elem.attrib["hash"]
+        # Walk the element and all its descendants without recursion
+        for node in elem.iter():
+            # Check if this element has a hash attribute
+            if "hash" not in node.attrib:
+                continue
+            
+            hash_value = node.attrib["hash"]
             
             # If it's an object element, try to map the class hash
-            if elem.tag == "object":
+            if node.tag == "object":
                 class_name = self.get_class_name(hash_value)
                 
                 # If we found a class name, replace the hash attribute with type
                 if class_name != hash_value:
-                    elem.attrib.pop("hash")
-                    elem.attrib["type"] = class_name
-            elif elem.tag == "value":
+                    node.attrib.pop("hash")
+                    node.attrib["type"] = class_name
+            elif node.tag == "value":
                 # For value elements with hash attributes, try to map the member hash
                 member_name = self.get_member_name(hash_value)
                 
                 # If we found a member name, replace the hash attribute with name
                 if member_name != hash_value:
-                    elem.attrib.pop("hash")
-                    elem.attrib["name"] = member_name
-        
-        # Recursively process all child elements
-        for child in elem:
-            self.parse_xml_element(child)
+                    node.attrib.pop("hash")
+                    node.attrib["name"] = member_name
         
         return elem
     
@@ -1,14 +1,32 @@
 # __init__.py
 # Initialization file for the Map Editor module
 
-from .data_models import Entity, GridConfig, MapInfo
-from .simplified_map_editor import SimplifiedMapEditor
+from importlib import import_module
+
+# Public name -> submodule it lives in. Imported on first attribute access
+# (PEP 562) so importing the package does not pull in PyQt6 and the editor.
+_LAZY_IMPORTS = {
+    'Entity': '.data_models',
+    'GridConfig': '.data_models',
+    'MapInfo': '.data_models',
+    'MapCanvas': '.canvas',
+    'SimplifiedMapEditor': '.simplified_map_editor',
+}
 
 __all__ = [
     'Entity',
     'GridConfig',
     'MapInfo',
     'MapCanvas',
-    'MinimapParser',
     'SimplifiedMapEditor',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import a public name from its submodule the first time it is used"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
\ No newline at end of file
@@ -1,11 +1,26 @@
 import sys
-import os
 import multiprocessing
+from pathlib import Path
 
 # CRITICAL: Must be first
 if __name__ == "__main__":
     multiprocessing.freeze_support()
 
+# Icon folder next to the exe (frozen) or this script - not the working directory
+ICON_DIR = (Path(sys.executable).parent if getattr(sys, 'frozen', False)
+            else Path(__file__).resolve().parent) / "icon"
+
+# QIcon (or None if the file is missing) per icon file name, loaded on first use
+_icon_cache = {}
+
+def _get_icon(icon_file):
+    """Cached QIcon for a file in the icon folder - needs a QApplication"""
+    if icon_file not in _icon_cache:
+        from PyQt6.QtGui import QIcon
+        icon_path = ICON_DIR / icon_file
+        _icon_cache[icon_file] = QIcon(str(icon_path)) if icon_path.exists() else None
+    return _icon_cache[icon_file]
+
 def main():
     """Main application entry point with game selection"""
 
@@ -15,15 +30,16 @@ def main():
 
     # 👉 Move GUI imports here so workers NEVER import them
     from PyQt6.QtWidgets import QApplication
-    from PyQt6.QtGui import QIcon
-    from game_selector import GameSelectorDialog
-    from simplified_map_editor import SimplifiedMapEditor
 
     app = QApplication(sys.argv)
 
-    default_icon_path = os.path.join("icon", "avatar_icon.ico")
-    if os.path.exists(default_icon_path):
-        app.setWindowIcon(QIcon(default_icon_path))
+    default_icon = _get_icon("avatar_icon.ico")
+    if default_icon:
+        app.setWindowIcon(default_icon)
+
+    # The selector shows without the editor module loaded - that is only
+    # imported once a game has actually been picked
+    from game_selector import GameSelectorDialog
 
     selector = GameSelectorDialog()
     result = selector.exec()
@@ -34,22 +50,23 @@ def main():
         if selected_game:
             print(f"Selected game: {selected_game}")
 
-            if "avatar" in selected_game.lower():
+            game_l = selected_game.lower()
+            if "avatar" in game_l:
                 icon_file = "avatar_icon.ico"
-            elif any(x in selected_game.lower() for x in ["fc2", "farcry"]):
+            elif any(x in game_l for x in ["fc2", "farcry"]):
                 icon_file = "fc2_icon.ico"
             else:
                 icon_file = "avatar_icon.ico"
 
-            icon_path = os.path.join("icon", icon_file)
-            game_icon = QIcon(icon_path) if os.path.exists(icon_path) else None
+            # Windows without their own icon use the app icon, so the editor
+            # only needs it switched when the game's icon is not the default
+            game_icon = _get_icon(icon_file)
+            if game_icon and game_icon is not default_icon:
+                app.setWindowIcon(game_icon)
 
+            from simplified_map_editor import SimplifiedMapEditor
             editor = SimplifiedMapEditor(game_mode=selected_game)
 
-            if game_icon:
-                editor.setWindowIcon(game_icon)
-                app.setWindowIcon(game_icon)
-
             editor.show()
             sys.exit(app.exec())
         else:
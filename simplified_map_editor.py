@@ -33,7 +33,8 @@ else:
     from entity_export_import import (
         show_entity_export_dialog, 
         show_entity_import_dialog,
-        setup_entity_export_import_system
+        setup_entity_export_import_system,
+        invalidate_worldsector_sources
     )
 
     from set_patch_folder import LevelSelectorDialog, integrate_patch_manager
@@ -1836,6 +1837,7 @@ class SimplifiedMapEditor(QMainWindow):
                 self.update_entity_statistics()
             if hasattr(self, 'entity_tree'):
                 self.update_entity_tree()
+            invalidate_worldsector_sources(self)
             if hasattr(self, 'canvas'):
                 self.canvas.set_entities(self.entities)
             
@@ -1931,6 +1933,7 @@ class SimplifiedMapEditor(QMainWindow):
             self.update_entity_tree()
         
         # Update canvas with new entities
+        invalidate_worldsector_sources(self)
         if hasattr(self, 'canvas'):
             self.canvas.set_entities(self.entities)
                                         
@@ -2700,6 +2703,7 @@ class SimplifiedMapEditor(QMainWindow):
             
             if hasattr(self, 'update_entity_statistics'):
                 self.update_entity_statistics()
+            invalidate_worldsector_sources(self)
             self.canvas.set_entities(self.entities)
             if hasattr(self, 'entity_tree'):
                 self.update_entity_tree()
@@ -3005,6 +3009,7 @@ class SimplifiedMapEditor(QMainWindow):
             if hasattr(self, 'update_entity_statistics'):
                 self.update_entity_statistics()
             
+            invalidate_worldsector_sources(self)
             self.canvas.set_entities(self.entities)
             
             if hasattr(self, 'entity_tree'):
@@ -6958,6 +6963,7 @@ class SimplifiedMapEditor(QMainWindow):
         print(f"Added {len(converted_entities)} converted entities. Total entities: {len(self.entities)}")
         
         # Update canvas with combined entities
+        invalidate_worldsector_sources(self)
         self.canvas.set_entities(self.entities)
         
         # Update entity browser
@@ -9038,6 +9044,13 @@ class SimplifiedMapEditor(QMainWindow):
             except Exception as e:
                 print(f"Error shutting down cache manager: {e}")
         
+        # Drop any conversions the file converter still has queued
+        if getattr(self, 'file_converter', None):
+            try:
+                self.file_converter.shutdown()
+            except Exception as e:
+                print(f"Error shutting down file converter: {e}")
+        
         # Close entity editor if open
         if hasattr(self, 'entity_editor') and self.entity_editor:
             try: